@@ -4,8 +4,31 @@ Python script to create professional AI research project structure
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 from pathlib import Path
 
+MKDIR_WORKERS = 16
+
+# Pre-encoded package __init__ payload, written verbatim with os.write
+SENTINEL_INIT = '''"""
+SENTINEL - Secure On-Premise Intelligent Surveillance System
+
+A professional AI-powered compliance monitoring system for capital market surveillance.
+"""
+
+__version__ = "0.1.0"
+__author__ = "Your Name"
+'''.encode("utf-8")
+
+def _mkdir_one(path):
+    """Create a single directory, returning False if it already existed."""
+    try:
+        os.mkdir(path)
+        return True
+    except FileExistsError:
+        return False
+
 def create_directories(base_path):
     """Create all directories for the project structure."""
     
@@ -120,18 +143,32 @@ def create_directories(base_path):
         "reports/presentations"
     ]
     
+    # Expand every leaf into its ancestors once, then create parent-first so
+    # each directory costs a single mkdir syscall (no parents=True re-walk)
+    unique_paths = {Path(d) for d in directories}
+    unique_paths.update(p for d in directories for p in Path(d).parents if p != Path("."))
+    sorted_paths = sorted(unique_paths, key=lambda p: (len(p.parts), p.as_posix()))
+    
+    # Only the base itself may need a recursive create; everything below it
+    # is a single mkdir per unique prefix
+    os.makedirs(base_path, exist_ok=True)
+    
     created = 0
     skipped = 0
     
-    for dir_path in directories:
-        full_path = Path(base_path) / dir_path
-        if not full_path.exists():
-            full_path.mkdir(parents=True, exist_ok=True)
-            print(f"✅ Created: {dir_path}")
-            created += 1
-        else:
-            print(f"⏭️  Skipped: {dir_path} (already exists)")
-            skipped += 1
+    # Directories at the same depth are independent, so fan each level out
+    # to a thread pool; levels run in order so parents always exist first
+    with ThreadPoolExecutor(max_workers=MKDIR_WORKERS) as executor:
+        for _, level in groupby(sorted_paths, key=lambda p: len(p.parts)):
+            level = list(level)
+            results = executor.map(_mkdir_one, [Path(base_path) / p for p in level])
+            for dir_path, was_created in zip(level, results):
+                if was_created:
+                    print(f"✅ Created: {dir_path.as_posix()}")
+                    created += 1
+                else:
+                    print(f"⏭️  Skipped: {dir_path.as_posix()} (already exists)")
+                    skipped += 1
     
     return created, skipped
 
@@ -162,22 +199,19 @@ def create_python_packages(base_path):
     
     for pkg in packages:
         init_file = Path(base_path) / pkg / "__init__.py"
-        if not init_file.exists():
-            if pkg == "src/sentinel":
-                content = '''"""
-SENTINEL - Secure On-Premise Intelligent Surveillance System
-
-A professional AI-powered compliance monitoring system for capital market surveillance.
-"""
-
-__version__ = "0.1.0"
-__author__ = "Your Name"
-'''
-            else:
-                content = ""
-            
-            init_file.write_text(content, encoding="utf-8")
-            print(f"✅ Created: {pkg}/__init__.py")
+        payload = SENTINEL_INIT if pkg == "src/sentinel" else b""
+        
+        # Exclusive create: one open() instead of exists() + write
+        try:
+            fd = os.open(init_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            continue
+        try:
+            if payload:
+                os.write(fd, payload)
+        finally:
+            os.close(fd)
+        print(f"✅ Created: {pkg}/__init__.py")
 
 def create_gitkeep_files(base_path):
     """Create .gitkeep files for directories that should be tracked but empty."""
@@ -194,9 +228,12 @@ def create_gitkeep_files(base_path):
     
     for dir_path in gitkeep_dirs:
         gitkeep_file = Path(base_path) / dir_path / ".gitkeep"
-        if not gitkeep_file.exists():
-            gitkeep_file.touch()
+        try:
+            fd = os.open(gitkeep_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            os.close(fd)
             print(f"✅ Created: {dir_path}/.gitkeep")
+        except FileExistsError:
+            pass
 
 def main():
     print("🏗️ Creating SENTINEL Professional Project Structure...")
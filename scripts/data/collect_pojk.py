@@ -5,13 +5,18 @@ Automatically download POJK (Peraturan OJK) documents from ojk.go.id
 Target: 20+ PDF documents about insider trading and market regulation
 """
 
+import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import re
+import shutil
 from pathlib import Path
-import time
 import json
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from typing import List, Dict, Tuple
 import logging
 from datetime import datetime
 
@@ -20,11 +25,90 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class POJKEntry:
+    """Curated POJK document with its precomputed local filename"""
+    number: str
+    title: str
+    year: int
+    category: str
+    url: str
+    relevance: str
+    filename: str = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'filename', f"{self.number.replace('/', '-')}.pdf")
+
+
+# Based on research, these are critical POJK for insider trading detection
+_POJK_LIST: Tuple[POJKEntry, ...] = (
+    POJKEntry(
+        number='POJK 30/2016',
+        title='Transaksi Material dan Perubahan Kegiatan Usaha',
+        year=2016,
+        category='Pasar Modal',
+        url='https://www.ojk.go.id/id/regulasi/Documents/Pages/Transaksi-Material-dan-Perubahan-Kegiatan-Usaha/POJK%2030%20-%202016.pdf',
+        relevance='HIGH'
+    ),
+    POJKEntry(
+        number='POJK 31/2016',
+        title='Transaksi Afiliasi dan Benturan Kepentingan',
+        year=2016,
+        category='Pasar Modal',
+        url='https://www.ojk.go.id/id/regulasi/Documents/Pages/Transaksi-Afiliasi-dan-Benturan-Kepentingan/POJK%2031%20-%202016.pdf',
+        relevance='HIGH'
+    ),
+    POJKEntry(
+        number='POJK 33/2014',
+        title='Direksi dan Dewan Komisaris Emiten atau Perusahaan Publik',
+        year=2014,
+        category='Pasar Modal',
+        url='https://www.ojk.go.id/id/regulasi/Documents/Pages/Direksi-dan-Dewan-Komisaris/POJK%2033-2014.pdf',
+        relevance='HIGH'
+    ),
+    POJKEntry(
+        number='POJK 34/2014',
+        title='Komite Audit pada Emiten atau Perusahaan Publik',
+        year=2014,
+        category='Pasar Modal',
+        url='https://www.ojk.go.id/id/regulasi/Documents/Pages/Komite-Audit/POJK%2034-2014.pdf',
+        relevance='MEDIUM'
+    ),
+    POJKEntry(
+        number='POJK 35/2014',
+        title='Sekretaris Perusahaan pada Emiten atau Perusahaan Publik',
+        year=2014,
+        category='Pasar Modal',
+        url='https://www.ojk.go.id/id/regulasi/Documents/Pages/Sekretaris-Perusahaan/POJK%2035-2014.pdf',
+        relevance='MEDIUM'
+    ),
+)
+
+# Manual list of important POJK numbers with their regulation page URLs
+# These are known relevant regulations
+_IMPORTANT_POJK: Tuple[Tuple[str, str], ...] = tuple(
+    (number, f"https://www.ojk.go.id/id/regulasi/{number.replace('/', '-').lower()}/")
+    for number in (
+        "POJK 30/2016",  # Transaksi Material
+        "POJK 31/2016",  # Keterbukaan Informasi Transaksi Afiliasi
+        "POJK 35/2015",  # Penyelenggaraan Usaha Perusahaan Pembiayaan
+        "POJK 11/2020",  # Stimulus Penanganan Covid-19
+        "POJK 32/2014",  # Rencana & Penyelenggaraan RUPS
+        "POJK 33/2014",  # Direksi & Dewan Komisaris
+        "POJK 34/2014",  # Komite Audit
+        "POJK 35/2014",  # Sekretaris Perusahaan
+        "POJK 13/2017",  # Penggunaan Jasa Konsultan Hukum, Akuntan, dan Penilai
+    )
+)
+
+
 class POJKCollector:
     """Collect POJK PDF documents from OJK website"""
 
-    def __init__(self, output_dir: str = "data/raw/regulations"):
+    def __init__(self, output_dir: str = "data/raw/regulations", max_workers: int = 4):
         self.output_dir = Path(output_dir)
+        # Concurrent downloads per host - be respectful to OJK servers
+        self.max_workers = max_workers
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         self.session = requests.Session()
@@ -32,6 +116,19 @@ class POJKCollector:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
 
+        # Keep-alive connection pool so every PDF reuses the same TLS session
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         self.metadata = []
 
     def search_pojk(self, keywords: List[str]) -> List[Dict]:
@@ -55,26 +152,12 @@ class POJKCollector:
         for keyword in keywords:
             logger.info(f"Searching for: {keyword}")
 
-            # Manual list of important POJK numbers
-            # These are known relevant regulations
-            important_pojk = [
-                "POJK 30/2016",  # Transaksi Material
-                "POJK 31/2016",  # Keterbukaan Informasi Transaksi Afiliasi
-                "POJK 35/2015",  # Penyelenggaraan Usaha Perusahaan Pembiayaan
-                "POJK 11/2020",  # Stimulus Penanganan Covid-19
-                "POJK 32/2014",  # Rencana & Penyelenggaraan RUPS
-                "POJK 33/2014",  # Direksi & Dewan Komisaris
-                "POJK 34/2014",  # Komite Audit
-                "POJK 35/2014",  # Sekretaris Perusahaan
-                "POJK 13/2017",  # Penggunaan Jasa Konsultan Hukum, Akuntan, dan Penilai
-            ]
-
             # Add to search list
-            for pojk_num in important_pojk:
+            for pojk_num, url in _IMPORTANT_POJK:
                 found_docs.append({
                     'title': f"Peraturan OJK {pojk_num}",
                     'number': pojk_num,
-                    'url': f"https://www.ojk.go.id/id/regulasi/{pojk_num.replace('/', '-').lower()}/",
+                    'url': url,
                     'keywords': [keyword],
                     'source': 'ojk.go.id'
                 })
@@ -93,80 +176,41 @@ class POJKCollector:
         Returns:
             True if successful
         """
+        filepath = self.output_dir / filename
+
         try:
             logger.info(f"Downloading: {filename}")
 
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            with self.session.get(url, stream=True, timeout=(5, 30)) as response:
+                response.raise_for_status()
 
-            # Check if actually PDF
-            content_type = response.headers.get('Content-Type', '')
-            if 'pdf' not in content_type.lower():
-                logger.warning(f"Not a PDF: {content_type}")
-                return False
+                # Check if actually PDF
+                content_type = response.headers.get('Content-Type', '')
+                if 'pdf' not in content_type.lower():
+                    logger.warning(f"Not a PDF: {content_type}")
+                    return False
 
-            # Save file
-            filepath = self.output_dir / filename
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+                # Stream body to disk in 1 MB chunks instead of buffering it in RAM
+                response.raw.decode_content = True
+                with open(filepath, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=1 << 20)
+                    size = f.tell()
 
-            logger.info(f"✅ Downloaded: {filename} ({len(response.content) / 1024:.1f} KB)")
+            logger.info(f"✅ Downloaded: {filename} ({size / 1024:.1f} KB)")
             return True
 
         except Exception as e:
             logger.error(f"❌ Download failed: {e}")
+            # Don't leave a truncated PDF behind - it would be skipped next run
+            filepath.unlink(missing_ok=True)
             return False
 
-    def get_manual_pojk_list(self) -> List[Dict]:
+    def get_manual_pojk_list(self) -> Tuple[POJKEntry, ...]:
         """
         Get manually curated list of important POJK documents
         Since web scraping OJK is complex, we use known important documents
         """
-        # Based on research, these are critical POJK for insider trading detection
-        pojk_list = [
-            {
-                'number': 'POJK 30/2016',
-                'title': 'Transaksi Material dan Perubahan Kegiatan Usaha',
-                'year': 2016,
-                'category': 'Pasar Modal',
-                'url': 'https://www.ojk.go.id/id/regulasi/Documents/Pages/Transaksi-Material-dan-Perubahan-Kegiatan-Usaha/POJK%2030%20-%202016.pdf',
-                'relevance': 'HIGH'
-            },
-            {
-                'number': 'POJK 31/2016',
-                'title': 'Transaksi Afiliasi dan Benturan Kepentingan',
-                'year': 2016,
-                'category': 'Pasar Modal',
-                'url': 'https://www.ojk.go.id/id/regulasi/Documents/Pages/Transaksi-Afiliasi-dan-Benturan-Kepentingan/POJK%2031%20-%202016.pdf',
-                'relevance': 'HIGH'
-            },
-            {
-                'number': 'POJK 33/2014',
-                'title': 'Direksi dan Dewan Komisaris Emiten atau Perusahaan Publik',
-                'year': 2014,
-                'category': 'Pasar Modal',
-                'url': 'https://www.ojk.go.id/id/regulasi/Documents/Pages/Direksi-dan-Dewan-Komisaris/POJK%2033-2014.pdf',
-                'relevance': 'HIGH'
-            },
-            {
-                'number': 'POJK 34/2014',
-                'title': 'Komite Audit pada Emiten atau Perusahaan Publik',
-                'year': 2014,
-                'category': 'Pasar Modal',
-                'url': 'https://www.ojk.go.id/id/regulasi/Documents/Pages/Komite-Audit/POJK%2034-2014.pdf',
-                'relevance': 'MEDIUM'
-            },
-            {
-                'number': 'POJK 35/2014',
-                'title': 'Sekretaris Perusahaan pada Emiten atau Perusahaan Publik',
-                'year': 2014,
-                'category': 'Pasar Modal',
-                'url': 'https://www.ojk.go.id/id/regulasi/Documents/Pages/Sekretaris-Perusahaan/POJK%2035-2014.pdf',
-                'relevance': 'MEDIUM'
-            },
-        ]
-
-        return pojk_list
+        return _POJK_LIST
 
     def collect_all(self, max_documents: int = 20) -> int:
         """
@@ -187,34 +231,32 @@ class POJKCollector:
 
         downloaded = 0
         failed = []
+        pending = []
 
         for i, pojk in enumerate(pojk_list[:max_documents], 1):
-            print(f"\n[{i}/{min(len(pojk_list), max_documents)}] {pojk['title']}")
-            print("-" * 80)
-
-            # Create filename
-            filename = f"{pojk['number'].replace('/', '-')}.pdf"
+            logger.debug(f"[{i}/{min(len(pojk_list), max_documents)}] {pojk.title}")
 
             # Check if already downloaded
-            if (self.output_dir / filename).exists():
-                logger.info(f"⏭️  Skipping (already exists): {filename}")
+            if (self.output_dir / pojk.filename).exists():
+                logger.info(f"⏭️  Skipping (already exists): {pojk.filename}")
                 downloaded += 1
                 continue
 
-            # Download
-            success = self.download_pdf(pojk['url'], filename)
-
-            if success:
-                downloaded += 1
-                self.metadata.append(pojk)
+            pending.append(pojk)
 
-                # Rate limiting - be respectful to OJK servers
-                time.sleep(2)
-            else:
-                failed.append(pojk['number'])
+        # Download concurrently; the pool size caps in-flight requests to OJK
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(
+                lambda pojk: self.download_pdf(pojk.url, pojk.filename),
+                pending
+            )
 
-            if downloaded >= max_documents:
-                break
+            for pojk, success in zip(pending, results):
+                if success:
+                    downloaded += 1
+                    self.metadata.append(asdict(pojk))
+                else:
+                    failed.append(pojk.number)
 
         # Save metadata
         self._save_metadata()
@@ -249,6 +291,17 @@ class POJKCollector:
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description='Download POJK regulation PDFs')
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Log per-document progress'
+    )
+    args = parser.parse_args()
+
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+
     print("=" * 80)
     print("📚 SENTINEL - POJK PDF Collector")
     print("=" * 80)
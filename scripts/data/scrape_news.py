@@ -8,16 +8,22 @@ Usage:
 """
 
 import argparse
+import csv
+import hashlib
 import logging
+import shelve
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
-import pandas as pd
-import requests
+from types import MappingProxyType
+from typing import List, Dict, Optional
+import httpx
 from bs4 import BeautifulSoup
+import soupsieve
 from urllib.parse import urljoin, urlparse
-import random
 
 # Setup logging
 logging.basicConfig(
@@ -25,36 +31,126 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO; keep the scraper's own progress readable
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
+# C-backed lxml parses article HTML several times faster than html.parser
+try:
+    from lxml import etree
+    HTML_PARSER = 'lxml'
+except ImportError:
+    etree = None
+    HTML_PARSER = 'html.parser'
+
+# HTTP/2 multiplexes concurrent article fetches over one TLS connection per host;
+# httpx needs the optional h2 package for it and otherwise speaks HTTP/1.1
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Statuses retried with exponential backoff
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Headers to avoid being blocked; shared read-only by every scraper instance
+DEFAULT_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7',
+})
+
+
+class HostRateLimiter:
+    """Thread-safe token bucket per host, so politeness delays only apply to the same site"""
+    
+    def __init__(self, rate: float = 0.5, burst: int = 1):
+        """
+        Args:
+            rate: Sustained requests per second allowed per host
+            burst: Requests a host may receive back-to-back before throttling
+        """
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, tuple] = {}  # host -> (tokens, last monotonic time)
+        self._lock = threading.Lock()
+    
+    def acquire(self, url: str):
+        """Block until a request to the URL's host is within budget"""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(host, (self.burst, now))
+            # Refill since the last request, then reserve one token; a negative
+            # balance is a reservation that this caller sleeps off
+            tokens = min(self.burst, tokens + (now - last) * self.rate) - 1
+            self._buckets[host] = (tokens, now)
+        
+        if tokens < 0:
+            time.sleep(-tokens / self.rate)
+
 
 class NewsScraper:
     """Base class for news scraping"""
     
-    def __init__(self, output_dir: str = "data/raw/news"):
+    SOURCE = "news"
+    FIELDNAMES = ['url', 'title', 'content', 'date', 'source', 'keyword', 'scraped_at']
+    
+    def __init__(self, output_dir: str = "data/raw/news", retries: int = 3, max_workers: int = 4,
+                 requests_per_second: float = 0.5):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Concurrent article fetches - be polite to the news sites
+        self.max_workers = max_workers
+        self.rate_limiter = HostRateLimiter(rate=requests_per_second, burst=1)
         
-        # Headers to avoid being blocked
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7',
-        }
+        self.headers = DEFAULT_HEADERS
         
-        self.articles = []
+        # Pooled keep-alive client shared by all worker threads; the transport
+        # retries failed connects, _stream() retries retryable statuses
+        self.retries = retries
+        self.backoff_factor = 1
+        self.client = httpx.Client(
+            headers=dict(self.headers),
+            timeout=httpx.Timeout(10.0),
+            follow_redirects=True,
+            transport=httpx.HTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                retries=retries,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+            )
+        )
         
-    def fetch_page(self, url: str, retries: int = 3) -> BeautifulSoup:
-        """Fetch page with retry logic"""
-        for attempt in range(retries):
-            try:
-                response = requests.get(url, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                return BeautifulSoup(response.content, 'html.parser')
-            except Exception as e:
-                logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
-                time.sleep(2 ** attempt)  # Exponential backoff
+        # Articles are streamed to CSV as they arrive instead of held in memory
+        self.article_count = 0
+        self.filename = None
+        self._csv_fp = None
+        self._writer = None
         
-        logger.error(f"Failed to fetch {url} after {retries} attempts")
-        return None
+    @contextmanager
+    def _stream(self, url: str):
+        """GET a URL over the shared client, retrying 429/5xx with exponential backoff"""
+        for attempt in range(self.retries + 1):
+            self.rate_limiter.acquire(url)
+            with self.client.stream('GET', url) as response:
+                if response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                    response.raise_for_status()
+                    yield response
+                    return
+            time.sleep(self.backoff_factor * 2 ** attempt)
+    
+    def fetch_page(self, url: str) -> BeautifulSoup:
+        """Fetch page over the pooled client"""
+        try:
+            with self._stream(url) as response:
+                return BeautifulSoup(response.read(), HTML_PARSER)
+        except Exception as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            return None
+    
+    def close(self):
+        """Release pooled connections"""
+        self.client.close()
     
     def clean_text(self, text: str) -> str:
         """Clean extracted text"""
@@ -62,33 +158,64 @@ class NewsScraper:
             return ""
         return " ".join(text.split()).strip()
     
-    def save_articles(self, source: str):
-        """Save scraped articles to CSV"""
-        if not self.articles:
+    def write_article(self, article: Dict):
+        """Append one article to the output CSV, opening it on first use"""
+        if self._writer is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.filename = self.output_dir / f"{self.SOURCE}_articles_{timestamp}.csv"
+            self._csv_fp = open(self.filename, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20)
+            self._writer = csv.DictWriter(self._csv_fp, fieldnames=self.FIELDNAMES)
+            self._writer.writeheader()
+        
+        self._writer.writerow(article)
+        self.article_count += 1
+    
+    def save_articles(self):
+        """Finish the streamed CSV of scraped articles"""
+        if self._csv_fp is None:
             logger.warning("No articles to save")
             return
         
-        df = pd.DataFrame(self.articles)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = self.output_dir / f"{source}_articles_{timestamp}.csv"
-        
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
-        logger.info(f"✅ Saved {len(self.articles)} articles to {filename}")
+        self._csv_fp.close()
+        self._csv_fp = None
+        self._writer = None
+        logger.info(f"✅ Saved {self.article_count} articles to {self.filename}")
         
-        return filename
+        return self.filename
 
 
 class KontanScraper(NewsScraper):
     """Scraper for Kontan.co.id"""
     
+    SOURCE = "kontan"
     BASE_URL = "https://newsrelease.kontan.co.id"
     SEARCH_URL = "https://newsrelease.kontan.co.id/search"
     
+    # Compiled once; adjust selector based on actual site structure
+    LINK_SELECTOR = soupsieve.compile('a.article-link')
+    # Article elements picked out while streaming the page
+    ARTICLE_TAGS = ('h1', 'div', 'time')
+    
     def scrape(self, keywords: List[str], max_articles: int = 100):
         """Scrape articles from Kontan"""
         logger.info(f"🔍 Scraping Kontan.co.id for keywords: {keywords}")
         
+        try:
+            # Persistent URL -> article cache so re-runs skip pages already scraped
+            with shelve.open(str(self.output_dir / '.url_cache')) as cache:
+                self._scrape_keywords(keywords, max_articles, cache)
+        finally:
+            self.close()
+        
+        return self.article_count
+    
+    def _scrape_keywords(self, keywords: List[str], max_articles: int, cache: shelve.Shelf):
+        """Search each keyword and scrape the linked articles"""
         for keyword in keywords:
+            remaining = max_articles - self.article_count
+            if remaining <= 0:
+                break
+            
             logger.info(f"Searching for: {keyword}")
             
             # Search page
@@ -98,32 +225,110 @@ class KontanScraper(NewsScraper):
             if not soup:
                 continue
             
-            # Find article links (adjust selector based on actual site structure)
-            article_links = soup.find_all('a', class_='article-link')  # Example selector
+            # Find article links, stopping once the remaining budget is filled
+            article_links = self.LINK_SELECTOR.select(soup, limit=remaining)
+            
+            article_urls = []
+            for link in article_links:
+                article_url = urljoin(self.BASE_URL, link.get('href'))
+                cached = cache.get(self._cache_key(article_url))
+                if cached:
+                    self.write_article({**cached, 'keyword': keyword})
+                    logger.info(f"⏭️  Cached: {cached['title'][:50]}...")
+                else:
+                    article_urls.append(article_url)
             
-            for link in article_links[:max_articles]:
-                if len(self.articles) >= max_articles:
-                    break
+            # Fetch articles concurrently over the shared client; the pool
+            # size bounds how many requests are in flight at once
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = executor.map(
+                    lambda url: self._scrape_article_safely(url, keyword),
+                    article_urls
+                )
                 
-                try:
-                    article_url = urljoin(self.BASE_URL, link.get('href'))
-                    article_data = self.scrape_article(article_url, keyword)
-                    
+                for article_url, article_data in zip(article_urls, results):
                     if article_data:
-                        self.articles.append(article_data)
+                        cache[self._cache_key(article_url)] = article_data
+                        self.write_article(article_data)
                         logger.info(f"✅ Scraped: {article_data['title'][:50]}...")
-                    
-                    # Be polite - don't hammer the server
-                    time.sleep(random.uniform(1, 3))
-                
-                except Exception as e:
-                    logger.error(f"Error scraping article: {e}")
-                    continue
-        
-        return self.articles
+    
+    @staticmethod
+    def _cache_key(url: str) -> str:
+        """Stable on-disk cache key for an article URL"""
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+    
+    def _scrape_article_safely(self, url: str, keyword: str) -> Dict:
+        """Scrape one article in a worker; the per-host rate limiter keeps it polite"""
+        try:
+            return self.scrape_article(url, keyword)
+        except Exception as e:
+            logger.error(f"Error scraping article: {e}")
+            return None
     
     def scrape_article(self, url: str, keyword: str) -> Dict:
         """Scrape individual article"""
+        if etree is not None:
+            fields = self.stream_article_fields(url)
+        else:
+            fields = self.parse_article_fields(url)
+        
+        if fields is None:
+            return None
+        
+        return {
+            'url': url,
+            'title': self.clean_text(fields.get('title')),
+            'content': self.clean_text(fields.get('content')),
+            'date': fields.get('date') or datetime.now().isoformat(timespec='seconds'),
+            'source': 'Kontan',
+            'keyword': keyword,
+            'scraped_at': datetime.now().isoformat(timespec='seconds')
+        }
+    
+    def stream_article_fields(self, url: str) -> Optional[Dict[str, str]]:
+        """
+        Parse an article page chunk by chunk as it downloads
+        
+        Stops reading the body as soon as title, content and date have been
+        seen, so footers/ads are never downloaded and memory stays bounded.
+        """
+        fields = {}
+        try:
+            with self._stream(url) as response:
+                parser = etree.HTMLPullParser(events=('end',), tag=self.ARTICLE_TAGS)
+                
+                for chunk in response.iter_bytes(chunk_size=8192):
+                    parser.feed(chunk)
+                    self._collect_article_fields(parser, fields)
+                    if len(fields) == len(self.ARTICLE_TAGS):
+                        break
+                else:
+                    parser.close()
+                    self._collect_article_fields(parser, fields)
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Error parsing article {url}: {e}")
+            return None
+        
+        return fields
+    
+    @staticmethod
+    def _collect_article_fields(parser, fields: Dict[str, str]):
+        """Pick article fields out of the parser's completed elements"""
+        # Adjust selectors based on actual site structure
+        for _, element in parser.read_events():
+            classes = (element.get('class') or '').split()
+            if element.tag == 'h1' and 'article-title' in classes:
+                fields.setdefault('title', ''.join(element.itertext()))
+            elif element.tag == 'div' and 'article-content' in classes:
+                fields.setdefault('content', ''.join(element.itertext()))
+            elif element.tag == 'time':
+                fields.setdefault('date', element.get('datetime'))
+    
+    def parse_article_fields(self, url: str) -> Optional[Dict[str, str]]:
+        """Fallback without lxml: download the full page and parse with BeautifulSoup"""
         soup = self.fetch_page(url)
         
         if not soup:
@@ -132,22 +337,13 @@ class KontanScraper(NewsScraper):
         try:
             # Extract article data (adjust selectors based on actual site)
             title = soup.find('h1', class_='article-title')
-            title = self.clean_text(title.get_text()) if title else ""
-            
             content = soup.find('div', class_='article-content')
-            content = self.clean_text(content.get_text()) if content else ""
-            
             date = soup.find('time')
-            date_str = date.get('datetime') if date else datetime.now().isoformat()
             
             return {
-                'url': url,
-                'title': title,
-                'content': content,
-                'date': date_str,
-                'source': 'Kontan',
-                'keyword': keyword,
-                'scraped_at': datetime.now().isoformat()
+                'title': title.get_text() if title else "",
+                'content': content.get_text() if content else "",
+                'date': date.get('datetime') if date else None
             }
         
         except Exception as e:
@@ -158,6 +354,7 @@ class KontanScraper(NewsScraper):
 class CNBCScraper(NewsScraper):
     """Scraper for CNBC Indonesia"""
     
+    SOURCE = "cnbc"
     BASE_URL = "https://www.cnbcindonesia.com"
     
     def scrape(self, keywords: List[str], max_articles: int = 100):
@@ -168,12 +365,13 @@ class CNBCScraper(NewsScraper):
         # Adjust selectors based on CNBC Indonesia's structure
         
         logger.warning("CNBC scraper not fully implemented - requires site structure analysis")
-        return []
+        return 0
 
 
 class BisnisScraper(NewsScraper):
     """Scraper for Bisnis.com"""
     
+    SOURCE = "bisnis"
     BASE_URL = "https://finansial.bisnis.com"
     
     def scrape(self, keywords: List[str], max_articles: int = 100):
@@ -184,7 +382,7 @@ class BisnisScraper(NewsScraper):
         # Adjust selectors based on Bisnis.com's structure
         
         logger.warning("Bisnis scraper not fully implemented - requires site structure analysis")
-        return []
+        return 0
 
 
 def main():
@@ -229,11 +427,11 @@ def main():
         logger.info(f"{'='*60}")
         
         scraper = scrapers[source]()
-        articles = scraper.scrape(args.keywords, args.max_articles)
+        article_count = scraper.scrape(args.keywords, args.max_articles)
         
-        if articles:
-            filename = scraper.save_articles(source)
-            logger.info(f"✅ {source}: {len(articles)} articles saved to {filename}")
+        if article_count:
+            filename = scraper.save_articles()
+            logger.info(f"✅ {source}: {article_count} articles saved to {filename}")
         else:
             logger.warning(f"⚠️  {source}: No articles scraped")
     
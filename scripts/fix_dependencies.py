@@ -4,6 +4,7 @@ Run this to fix the environment
 """
 import subprocess
 import sys
+from importlib.metadata import PackageNotFoundError, version
 
 def fix_dependencies():
     """Fix protobuf and related dependencies"""
@@ -11,33 +12,34 @@ def fix_dependencies():
     print("🔧 Fixing Dependency Conflicts")
     print("=" * 60)
 
-    fixes = [
-        # Uninstall conflicting versions
-        ("Uninstalling old protobuf", ["pip", "uninstall", "-y", "protobuf"]),
-
-        # Install specific compatible version
-        ("Installing protobuf 3.20.3", ["pip", "install", "protobuf==3.20.3"]),
-
-        # Reinstall chromadb with correct deps
-        ("Reinstalling chromadb", ["pip", "install", "--upgrade", "--force-reinstall", "chromadb"]),
-
-        # Verify installation
-        ("Verifying installation", ["pip", "show", "protobuf"]),
+    # One pip run resolves the pinned protobuf and chromadb together, so pip's
+    # startup and dependency resolution are paid once (and chromadb can't
+    # pull protobuf back off the pinned version)
+    description = "Reinstalling protobuf 3.20.3 and chromadb"
+    command = [
+        sys.executable, "-m", "pip", "install", "--quiet",
+        "--upgrade", "--force-reinstall",
+        "protobuf==3.20.3", "chromadb"
     ]
 
-    for description, command in fixes:
-        print(f"\n📦 {description}...")
-        try:
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            print(f"✅ {description} - SUCCESS")
-        except subprocess.CalledProcessError as e:
-            print(f"⚠️ {description} - Warning: {e}")
-            continue
+    print(f"\n📦 {description}...")
+    try:
+        subprocess.run(
+            command,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        print(f"✅ {description} - SUCCESS")
+    except subprocess.CalledProcessError as e:
+        print(f"⚠️ {description} - Warning: {e}")
+
+    # Verify installation in-process instead of spawning `pip show`
+    print("\n📦 Verifying installation...")
+    try:
+        print(f"✅ protobuf {version('protobuf')} installed")
+    except PackageNotFoundError:
+        print("⚠️ Verifying installation - Warning: protobuf not found")
 
     print("\n" + "=" * 60)
     print("✅ Dependency fixes complete!")
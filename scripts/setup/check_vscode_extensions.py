@@ -4,9 +4,19 @@ Check currently installed VS Code extensions against recommended list
 
 import subprocess
 import json
+import re
 from pathlib import Path
 from typing import Set, Dict, List
 
+try:
+    import pyjson5
+except ImportError:
+    pyjson5 = None
+
+# Matches a JSON string (kept) or a // comment (dropped), so `//` inside
+# strings such as marketplace URLs survives comment stripping
+_STRING_OR_COMMENT = re.compile(r'("(?:\\.|[^"\\])*")|//[^\n]*')
+
 def get_installed_extensions() -> Set[str]:
     """Get list of currently installed VS Code extensions"""
     try:
@@ -16,7 +26,7 @@ def get_installed_extensions() -> Set[str]:
             text=True,
             check=True
         )
-        return set(result.stdout.strip().split('\n'))
+        return set(result.stdout.split())
     except subprocess.CalledProcessError:
         print("❌ Error: Could not get installed extensions")
         return set()
@@ -35,24 +45,19 @@ def get_recommended_extensions() -> List[str]:
     with open(ext_file, 'r', encoding='utf-8') as f:
         content = f.read()
 
-        # Remove single-line comments (// ...)
-        lines = content.split('\n')
-        cleaned_lines = []
-        for line in lines:
-            # Remove comment part if exists
-            if '//' in line:
-                # Keep the part before //
-                line = line.split('//')[0]
-            cleaned_lines.append(line)
+        # extensions.json is JSON-with-comments; pyjson5 parses it natively in C
+        if pyjson5 is not None:
+            return pyjson5.loads(content).get('recommendations', [])
 
-        cleaned_content = '\n'.join(cleaned_lines)
+        # Remove single-line comments (// ...) in one pass
+        cleaned_content = _STRING_OR_COMMENT.sub(lambda m: m.group(1) or '', content)
 
         data = json.loads(cleaned_content)
         return data.get('recommendations', [])
 
 def categorize_extensions(recommended: List[str], installed: Set[str]) -> Dict[str, List[str]]:
     """Categorize extensions by installation status"""
-    installed_lower = {ext.lower() for ext in installed}
+    installed_lower = frozenset(ext.lower() for ext in installed)
 
     categories = {
         'installed': [],
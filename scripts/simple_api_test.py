@@ -1,11 +1,25 @@
 """
 Simplified FastAPI test - No heavy dependencies
 """
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from datetime import datetime
 
-app = FastAPI(title="SENTINEL API Test")
+# libuv event loop + C HTTP parser; uvloop has no Windows build, so fall back there
+try:
+    import uvloop  # noqa: F401
+    EVENT_LOOP = "uvloop"
+except ImportError:
+    EVENT_LOOP = "asyncio"
+
+try:
+    import httptools  # noqa: F401
+    HTTP_PROTOCOL = "httptools"
+except ImportError:
+    HTTP_PROTOCOL = "h11"
+
+app = FastAPI(title="SENTINEL API Test", default_response_class=ORJSONResponse)
 
 @app.get("/")
 async def root():
@@ -13,7 +27,7 @@ async def root():
         "service": "SENTINEL API",
         "version": "1.0.0",
         "status": "operational",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now().isoformat(timespec="seconds")
     }
 
 @app.get("/health")
@@ -21,17 +35,17 @@ async def health():
     return {
         "status": "healthy",
         "version": "1.0.0",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now().isoformat(timespec="seconds")
     }
 
 @app.post("/api/test")
 async def test_endpoint(request: Request):
     """Simple test endpoint"""
-    body = await request.json()
+    body = orjson.loads(await request.body())
     return {
         "received": body,
         "status": "success",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now().isoformat(timespec="seconds")
     }
 
 if __name__ == "__main__":
@@ -41,6 +55,7 @@ if __name__ == "__main__":
     print("=" * 60)
     print("Starting server at http://localhost:8000")
     print("Docs at http://localhost:8000/docs")
+    print(f"Event loop: {EVENT_LOOP}, HTTP parser: {HTTP_PROTOCOL}")
     print("=" * 60)
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop=EVENT_LOOP, http=HTTP_PROTOCOL, workers=1)
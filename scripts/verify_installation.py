@@ -3,10 +3,18 @@ SENTINEL Project - Installation Verification Script
 Run this to verify all components are installed correctly
 """
 
+import argparse
+import hashlib
+import json
 import sys
+import sysconfig
 import importlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, List, Tuple
 
+CACHE_DIR = Path.home() / ".cache" / "sentinel"
+
 def check_package(package_name: str, import_name: str = None) -> Tuple[bool, str]:
     """Check if a package is installed and return version."""
     try:
@@ -17,7 +25,42 @@ def check_package(package_name: str, import_name: str = None) -> Tuple[bool, str
     except ImportError:
         return False, "NOT INSTALLED"
 
+def get_cache_file() -> Path:
+    """
+    Cache file for this interpreter's import results.
+
+    Keyed by the interpreter path and site-packages mtime, so installing or
+    removing a package (or switching venvs) starts a fresh cache.
+    """
+    purelib = Path(sysconfig.get_paths()['purelib'])
+    stamp = f"{sys.executable}:{Path(sys.executable).stat().st_mtime}:{purelib.stat().st_mtime}"
+    key = hashlib.sha1(stamp.encode()).hexdigest()[:12]
+    return CACHE_DIR / f"verify_{key}.json"
+
+def load_cached_results(cache_file: Path) -> Dict[str, List]:
+    """Load cached {"package:import_name": [success, version]} results"""
+    try:
+        return json.loads(cache_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+def save_cached_results(cache_file: Path, results: Dict[str, List]):
+    """Persist import results; a failed write just means no cache next run"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(results), encoding='utf-8')
+    except OSError:
+        pass
+
 def main():
+    parser = argparse.ArgumentParser(description='Verify SENTINEL installation')
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-import every package instead of using cached results'
+    )
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("🛡️ SENTINEL Installation Verification")
     print("=" * 60)
@@ -84,12 +127,27 @@ def main():
     installed_count = 0
     failed_packages = []
     
+    # Reuse results from a previous run against the same environment, import
+    # everything else concurrently (extension loading releases the GIL),
+    # then report in declared order
+    cache_file = get_cache_file()
+    cached = {} if args.no_cache else load_cached_results(cache_file)
+    flat = [pkg for pkg_list in packages.values() for pkg in pkg_list]
+    results = {
+        pkg: tuple(cached[":".join(pkg)]) for pkg in flat if ":".join(pkg) in cached
+    }
+    pending = [pkg for pkg in flat if pkg not in results]
+    if pending:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results.update(zip(pending, executor.map(lambda pkg: check_package(*pkg), pending)))
+        save_cached_results(cache_file, {":".join(pkg): list(result) for pkg, result in results.items()})
+    
     for category, pkg_list in packages.items():
         print(f"📦 {category}")
         print("-" * 60)
         
         for package_name, import_name in pkg_list:
-            success, version = check_package(package_name, import_name)
+            success, version = results[(package_name, import_name)]
             
             if success:
                 print(f"  ✅ {package_name:30s} {version}")
@@ -1,30 +1,86 @@
 """
 SENTINEL FastAPI Main Application
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
+from fastapi.responses import ORJSONResponse
 import time
 from datetime import datetime
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+import httpx
 from dotenv import load_dotenv
 
 from .models.schemas import HealthResponse
+from .middleware.rate_limit import create_rate_limiter
 from .routers import analysis
+from .services.analysis_service import get_default_analysis_service
 
 load_dotenv()
 
-# Setup logging
+# Setup logging (while the app is running, root handlers are moved behind a
+# queue - see start_log_listener)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("sentinel.api")
 audit_logger = logging.getLogger("sentinel.audit")
 
-# Rate limiter
-limiter = Limiter(key_func=get_remote_address)
+
+class LocalQueueHandler(QueueHandler):
+    """Enqueue records untouched - formatting happens on the listener thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def start_log_listener() -> QueueListener:
+    """
+    Make logging non-blocking
+
+    Replaces the root handlers with a queue and replays records to them from
+    a background thread, so request handlers never wait on stdout I/O.
+    """
+    root = logging.getLogger()
+    listener = QueueListener(queue.SimpleQueue(), *root.handlers, respect_handler_level=True)
+    root.handlers = [LocalQueueHandler(listener.queue)]
+    listener.start()
+    return listener
+
+
+def stop_log_listener(listener: QueueListener):
+    """Flush queued records and put the original handlers back"""
+    listener.stop()
+    logging.getLogger().handlers = list(listener.handlers)
+
+
+# Ollama health probe - result is reused for a few seconds so load balancer
+# probes don't each make an outbound call
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
+OLLAMA_STATUS_TTL = 5.0  # seconds
+_ollama_status_cache = (0.0, None)  # (monotonic timestamp, status)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources on startup and release them on shutdown"""
+    log_listener = start_log_listener()
+    app.state.http = httpx.AsyncClient(timeout=2.0)
+    app.state.analysis_service = get_default_analysis_service()
+    await app.state.analysis_service.start()
+    # Shared across workers via Redis; None disables limiting
+    app.state.rate_limiter = create_rate_limiter()
+    yield
+    await app.state.analysis_service.stop()
+    await app.state.http.aclose()
+    if app.state.rate_limiter is not None:
+        await app.state.rate_limiter.close()
+    # Don't leave closed clients behind for requests served without lifespan
+    app.state.http = None
+    app.state.rate_limiter = None
+    stop_log_listener(log_listener)
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -32,13 +88,11 @@ app = FastAPI(
     description="AI-powered compliance monitoring system for insider trading detection",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # C-level JSON encoding for responses
 )
 
-# Rate limit handler
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
 # CORS middleware - restrictive configuration
 allowed_origins = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
 app.add_middleware(
@@ -53,58 +107,84 @@ app.add_middleware(
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    """Log all requests"""
-    start_time = time.time()
-
-    # Log request
-    logger.info(f"{request.method} {request.url.path}")
+    """Log all requests (one line per request, with its processing time)"""
+    start_time = time.perf_counter()
 
     # Process request
     response = await call_next(request)
 
-    # Log response time
-    process_time = time.time() - start_time
-    logger.info(f"Completed in {process_time:.3f}s")
+    process_time = time.perf_counter() - start_time
+    logger.info(
+        "%s %s %d %.3fs",
+        request.method, request.url.path, response.status_code, process_time
+    )
 
     return response
 
 
+def request_timestamp(request: Request) -> datetime:
+    """Wall-clock timestamp for the request, taken once on first use"""
+    timestamp = getattr(request.state, "timestamp", None)
+    if timestamp is None:
+        timestamp = request.state.timestamp = datetime.now()
+    return timestamp
+
+
 # Exception handlers
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle uncaught exceptions"""
-    logger.error(f"Unhandled error: {exc}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unhandled error: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
             "message": "An unexpected error occurred. Please try again later.",
             "code": "INTERNAL_ERROR",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": request_timestamp(request).isoformat()
         }
     )
 
 
+async def get_ollama_status(request: Request) -> str:
+    """Probe Ollama without blocking the event loop, caching the result briefly"""
+    global _ollama_status_cache
+
+    checked_at, status = _ollama_status_cache
+    if status is not None and time.monotonic() - checked_at < OLLAMA_STATUS_TTL:
+        return status
+
+    try:
+        client = getattr(request.app.state, "http", None)
+        if client is not None:
+            ollama_response = await client.get(OLLAMA_TAGS_URL)
+        else:
+            # App started without lifespan (e.g. plain TestClient)
+            async with httpx.AsyncClient(timeout=2.0) as client:
+                ollama_response = await client.get(OLLAMA_TAGS_URL)
+        status = "healthy" if ollama_response.status_code == 200 else "unavailable"
+    except httpx.HTTPError:
+        status = "unavailable"
+
+    _ollama_status_cache = (time.monotonic(), status)
+    return status
+
+
 # Health check endpoint
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
-async def health_check():
+async def health_check(request: Request):
     """
     Health check endpoint
 
     Returns service status and Ollama availability
     """
-    try:
-        # Check Ollama status
-        import requests
-        ollama_response = requests.get("http://localhost:11434/api/tags", timeout=2)
-        ollama_status = "healthy" if ollama_response.status_code == 200 else "unavailable"
-    except:
-        ollama_status = "unavailable"
+    ollama_status = await get_ollama_status(request)
 
     return HealthResponse(
         status="healthy",
         version="1.0.0",
-        ollama_status=ollama_status
+        ollama_status=ollama_status,
+        timestamp=request_timestamp(request)
     )
 
 
@@ -127,10 +207,19 @@ app.include_router(analysis.router, prefix="/api/v1", tags=["Analysis"])
 
 if __name__ == "__main__":
     import uvicorn
+    from importlib.util import find_spec
+
+    # API_RELOAD=1 for development (single process); otherwise one worker per
+    # CPU - rate limits are shared through Redis, so workers stay consistent
+    reload = os.getenv("API_RELOAD", "0") == "1"
     uvicorn.run(
         "sentinel.api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        # libuv event loop + C HTTP parser (uvloop has no Windows build)
+        loop="uvloop" if find_spec("uvloop") else "asyncio",
+        http="httptools" if find_spec("httptools") else "h11",
+        reload=reload,
+        workers=None if reload else int(os.getenv("API_WORKERS", os.cpu_count() or 1)),
         log_level="info"
     )
@@ -3,13 +3,28 @@ Authentication Middleware
 """
 from fastapi import Header, HTTPException
 from typing import Optional
+import hashlib
+import hmac
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Load API keys from environment
-VALID_API_KEYS = set(os.getenv("API_KEYS", "dev-key-12345").split(","))
+# Load API keys from environment; only their SHA-256 digests are kept
+VALID_API_KEY_HASHES = tuple(
+    hashlib.sha256(key.encode()).digest()
+    for key in set(os.getenv("API_KEYS", "dev-key-12345").split(","))
+)
+
+
+def _is_valid_key(api_key: str) -> bool:
+    """Constant-time comparison of the key's digest against every valid digest"""
+    digest = hashlib.sha256(api_key.encode()).digest()
+    valid = False
+    for valid_hash in VALID_API_KEY_HASHES:
+        # No short-circuit: timing doesn't reveal which (or whether any) key matched
+        valid |= hmac.compare_digest(digest, valid_hash)
+    return valid
 
 
 async def verify_api_key(x_api_key: Optional[str] = Header(None)) -> str:
@@ -35,7 +50,7 @@ async def verify_api_key(x_api_key: Optional[str] = Header(None)) -> str:
             }
         )
 
-    if x_api_key not in VALID_API_KEYS:
+    if not _is_valid_key(x_api_key):
         raise HTTPException(
             status_code=403,
             detail={
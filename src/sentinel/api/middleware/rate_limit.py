@@ -0,0 +1,245 @@
+"""
+Rate Limiting Middleware
+
+Redis-backed limits shared by every API worker: a sliding one-minute request
+window plus a cap on concurrent analyses per API key, so bursts can't
+oversubscribe the LLM backend.
+"""
+
+from fastapi import Depends, HTTPException, Request
+from typing import AsyncIterator, Awaitable, Callable, Optional
+import hashlib
+import logging
+import os
+import time
+import uuid
+
+from .auth import verify_api_key
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+except ImportError:
+    aioredis = None
+    RedisError = Exception
+
+logger = logging.getLogger("sentinel.api.rate_limit")
+
+# Atomically prune expired entries, check both limits and record the request.
+# Members are "<request id>:<cost>", so a batch counts once per transaction; a
+# request costing more than a limit is only admitted when nothing else counts
+# against it (and then uses up the whole budget).
+# KEYS: rate window zset, in-flight zset
+# ARGV: now_ms, request_id, window_ms, rate_limit, max_concurrent, stale_ms, cost
+# Returns 0 when admitted, 1 when over the rate limit, 2 when over concurrency
+ACQUIRE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local cost = tonumber(ARGV[7])
+local function over(key, limit)
+    local used = 0
+    for _, member in ipairs(redis.call('ZRANGE', key, 0, -1)) do
+        used = used + tonumber(string.match(member, ':(%d+)$'))
+    end
+    return used > 0 and used + cost > limit
+end
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - tonumber(ARGV[3]))
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now - tonumber(ARGV[6]))
+if over(KEYS[1], tonumber(ARGV[4])) then
+    return 1
+end
+if over(KEYS[2], tonumber(ARGV[5])) then
+    return 2
+end
+redis.call('ZADD', KEYS[1], now, ARGV[2])
+redis.call('ZADD', KEYS[2], now, ARGV[2])
+redis.call('PEXPIRE', KEYS[1], ARGV[3])
+redis.call('PEXPIRE', KEYS[2], ARGV[6])
+return 0
+"""
+
+
+class RedisRateLimiter:
+    """Sliding-window + concurrency limiter stored in Redis sorted sets"""
+
+    def __init__(
+        self,
+        redis_url: str,
+        requests_per_minute: int = 10,
+        max_concurrent: int = 2,
+        stale_after: float = 120.0,
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            redis_url: Redis connection URL
+            requests_per_minute: Requests allowed per API key per minute
+            max_concurrent: In-flight analyses allowed per API key
+            stale_after: Seconds before an unreleased in-flight slot expires
+                (covers workers that died mid-request)
+        """
+        self.redis = aioredis.from_url(redis_url)
+        self.requests_per_minute = requests_per_minute
+        self.max_concurrent = max_concurrent
+        self.stale_after_ms = int(stale_after * 1000)
+        self._acquire = self.redis.register_script(ACQUIRE_SCRIPT)
+
+    @staticmethod
+    def _keys(api_key: str) -> tuple:
+        """Redis keys for an API key (hashed so raw keys never leave the process)"""
+        key_id = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        return f"sentinel:rl:rate:{key_id}", f"sentinel:rl:inflight:{key_id}"
+
+    async def acquire(self, api_key: str, cost: int = 1) -> str:
+        """
+        Reserve a request slot
+
+        Args:
+            api_key: Validated API key
+            cost: Requests this counts as (number of transactions for /batch)
+
+        Returns:
+            Request ID to pass to release()
+
+        Raises:
+            HTTPException: 429 if the rate or concurrency limit is exceeded
+        """
+        request_id = f"{uuid.uuid4().hex}:{cost}"
+        result = await self._acquire(
+            keys=self._keys(api_key),
+            args=[
+                int(time.time() * 1000),
+                request_id,
+                60_000,
+                self.requests_per_minute,
+                self.max_concurrent,
+                self.stale_after_ms,
+                cost,
+            ],
+        )
+
+        if result == 1:
+            raise HTTPException(
+                status_code=429,
+                detail={
+                    "error": "Rate limit exceeded",
+                    "message": f"Limit is {self.requests_per_minute} requests per minute",
+                    "code": "RATE_LIMITED",
+                },
+                headers={"Retry-After": "60"},
+            )
+        if result == 2:
+            raise HTTPException(
+                status_code=429,
+                detail={
+                    "error": "Too many concurrent requests",
+                    "message": f"Limit is {self.max_concurrent} analyses in flight",
+                    "code": "CONCURRENCY_LIMITED",
+                },
+                headers={"Retry-After": "1"},
+            )
+
+        return request_id
+
+    async def release(self, api_key: str, request_id: str):
+        """Free the in-flight slot (the rate window entry stays until it ages out)"""
+        await self.redis.zrem(self._keys(api_key)[1], request_id)
+
+    async def close(self):
+        """Close the Redis connection pool"""
+        await self.redis.aclose()
+
+
+def create_rate_limiter() -> Optional[RedisRateLimiter]:
+    """
+    Build the limiter from environment settings
+
+    Returns None (no limiting) when REDIS_URL is unset or redis isn't installed.
+    """
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url:
+        logger.warning("REDIS_URL not set - API rate limiting disabled")
+        return None
+    if aioredis is None:
+        logger.warning("redis package not installed - API rate limiting disabled")
+        return None
+
+    return RedisRateLimiter(
+        redis_url,
+        requests_per_minute=int(os.getenv("RATE_LIMIT_PER_MINUTE", "10")),
+        max_concurrent=int(os.getenv("MAX_CONCURRENT_ANALYSES", "2")),
+    )
+
+
+async def _release_nothing():
+    """Release callback for requests that hold no slot"""
+
+
+async def acquire_request_slot(
+    request: Request, api_key: str, cost: int = 1
+) -> Callable[[], Awaitable[None]]:
+    """
+    Reserve a rate-limited slot for the request
+
+    Redis outages fail open so analysis stays available.
+
+    Args:
+        request: Incoming request (the limiter lives on app.state)
+        api_key: Validated API key
+        cost: Requests this counts as (number of transactions for /batch)
+
+    Returns:
+        Coroutine function that releases the slot (a no-op when not limited)
+
+    Raises:
+        HTTPException: 429 if the rate or concurrency limit is exceeded
+    """
+    limiter = getattr(request.app.state, "rate_limiter", None)
+    if limiter is None:
+        return _release_nothing
+
+    try:
+        request_id = await limiter.acquire(api_key, cost)
+    except RedisError as e:
+        logger.warning("Rate limiter unavailable, allowing request: %s", e)
+        return _release_nothing
+
+    async def release():
+        """Free the in-flight slot"""
+        try:
+            await limiter.release(api_key, request_id)
+        except RedisError as e:
+            logger.warning("Failed to release rate limit slot: %s", e)
+
+    return release
+
+
+async def release_after_stream(
+    stream: AsyncIterator[bytes], release: Callable[[], Awaitable[None]]
+) -> AsyncIterator[bytes]:
+    """
+    Pass a response stream through, releasing its slot when the stream ends
+
+    Dependency cleanup runs before a StreamingResponse body is sent, so
+    streaming endpoints release from inside the body instead. A stream the
+    server never starts (client gone first) keeps its slot until stale_after.
+    """
+    try:
+        async for chunk in stream:
+            yield chunk
+    finally:
+        await release()
+
+
+async def enforce_rate_limit(request: Request, api_key: str = Depends(verify_api_key)):
+    """
+    Dependency: authenticate, then hold a rate-limited slot for the request
+
+    Yields the validated API key; the in-flight slot is released once the
+    endpoint returns. Not for streaming endpoints (see release_after_stream).
+    """
+    release = await acquire_request_slot(request, api_key)
+    try:
+        yield api_key
+    finally:
+        await release()
@@ -1,7 +1,7 @@
 """
 Pydantic models for API requests and responses
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Literal
 from datetime import datetime
 
@@ -18,18 +18,17 @@ class TransactionData(BaseModel):
     volume: int = Field(..., gt=0, description="Number of shares")
     price: float = Field(..., gt=0, description="Price per share")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "date": "2024-12-29T10:00:00",
-                "company": "BBCA",
-                "insider_name": "John Doe",
-                "insider_role": "Director",
-                "action": "SELL",
-                "volume": 100000,
-                "price": 9500
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "date": "2024-12-29T10:00:00",
+            "company": "BBCA",
+            "insider_name": "John Doe",
+            "insider_role": "Director",
+            "action": "SELL",
+            "volume": 100000,
+            "price": 9500
         }
+    })
 
 
 class Alert(BaseModel):
@@ -70,30 +69,46 @@ class AnalysisResponse(BaseModel):
     processing_time: float = Field(..., description="Processing time in seconds")
     timestamp: datetime = Field(default_factory=datetime.now)
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "transaction_id": "tx_123456",
-                "alerts": [
-                    {
-                        "severity": "HIGH",
-                        "title": "Quiet Period Violation",
-                        "description": "Transaction occurred 5 days before earnings announcement",
-                        "rule_violated": "POJK 30/2016 Pasal 4"
-                    }
-                ],
-                "risk_score": 0.78,
-                "citations": [
-                    {
-                        "source": "POJK-30-2016.pdf",
-                        "article": "Pasal 4 Ayat 1",
-                        "text": "Direksi dilarang melakukan transaksi dalam periode 30 hari sebelum..."
-                    }
-                ],
-                "processing_time": 2.34,
-                "timestamp": "2024-12-29T10:00:00"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "transaction_id": "tx_123456",
+            "alerts": [
+                {
+                    "severity": "HIGH",
+                    "title": "Quiet Period Violation",
+                    "description": "Transaction occurred 5 days before earnings announcement",
+                    "rule_violated": "POJK 30/2016 Pasal 4"
+                }
+            ],
+            "risk_score": 0.78,
+            "citations": [
+                {
+                    "source": "POJK-30-2016.pdf",
+                    "article": "Pasal 4 Ayat 1",
+                    "text": "Direksi dilarang melakukan transaksi dalam periode 30 hari sebelum..."
+                }
+            ],
+            "processing_time": 2.34,
+            "timestamp": "2024-12-29T10:00:00"
         }
+    })
+
+
+class BatchAnalysisRequest(BaseModel):
+    """Batch analysis request model"""
+    transactions: List[TransactionData] = Field(
+        ..., min_length=1, max_length=1000, description="Transactions to analyze"
+    )
+
+
+class BatchAnalysisResponse(BaseModel):
+    """Batch analysis response model"""
+    results: List[AnalysisResponse] = Field(
+        default_factory=list,
+        description="One analysis result per transaction, in request order"
+    )
+    total_transactions: int = Field(..., description="Number of transactions analyzed")
+    processing_time: float = Field(..., description="Processing time in seconds")
 
 
 class HealthResponse(BaseModel):
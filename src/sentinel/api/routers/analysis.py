@@ -1,13 +1,24 @@
 """
 Analysis API Router
 """
-from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi import APIRouter, HTTPException, Depends, Header, Request
+from fastapi.responses import StreamingResponse
 from typing import Optional
 import logging
 
-from ..models.schemas import AnalysisRequest, AnalysisResponse
-from ..services.analysis_service import AnalysisService
+from ..models.schemas import (
+    AnalysisRequest,
+    AnalysisResponse,
+    BatchAnalysisRequest,
+    BatchAnalysisResponse
+)
+from ..services.analysis_service import AnalysisService, get_default_analysis_service
 from ..middleware.auth import verify_api_key
+from ..middleware.rate_limit import (
+    acquire_request_slot,
+    enforce_rate_limit,
+    release_after_stream
+)
 
 logger = logging.getLogger("sentinel.api.routers.analysis")
 
@@ -15,23 +26,29 @@ router = APIRouter(prefix="/analyze", tags=["Analysis"])
 
 
 # Dependency: Get analysis service instance
-def get_analysis_service() -> AnalysisService:
-    """Dependency to get analysis service"""
-    return AnalysisService()
+def get_analysis_service(request: Request) -> AnalysisService:
+    """Dependency to get the shared analysis service built at startup"""
+    service = getattr(request.app.state, "analysis_service", None)
+    if service is None:
+        # App started without lifespan (e.g. plain TestClient)
+        service = get_default_analysis_service()
+    return service
 
 
-@router.post("/", response_model=AnalysisResponse)
+# None fields (e.g. an alert without rule_violated) are left out of the JSON
+@router.post("/", response_model=AnalysisResponse, response_model_exclude_none=True)
 async def analyze_transaction(
     request: AnalysisRequest,
     service: AnalysisService = Depends(get_analysis_service),
-    api_key: str = Depends(verify_api_key)
+    api_key: str = Depends(enforce_rate_limit)
 ):
     """
     Analyze a transaction for compliance violations
 
     **Authentication**: Requires valid API key in `X-API-Key` header
 
-    **Rate Limit**: 10 requests per minute
+    **Rate Limit**: 10 requests per minute and 2 concurrent analyses per API key
+    (Redis-backed, shared across workers; enabled when `REDIS_URL` is set)
 
     **Request Body**:
     - transaction: Transaction data to analyze
@@ -59,12 +76,12 @@ async def analyze_transaction(
     ```
     """
     try:
-        logger.info(f"Received analysis request for {request.transaction.company}")
+        logger.info("Received analysis request for %s", request.transaction.company)
         result = await service.analyze(request)
         return result
 
     except Exception as e:
-        logger.error(f"Analysis failed: {e}")
+        logger.error("Analysis failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail={
@@ -75,11 +92,89 @@ async def analyze_transaction(
         )
 
 
+@router.post("/batch", response_model=BatchAnalysisResponse, response_model_exclude_none=True)
+async def analyze_batch(
+    request: BatchAnalysisRequest,
+    http_request: Request,
+    service: AnalysisService = Depends(get_analysis_service),
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Analyze up to 1000 transactions in one request
+
+    **Authentication**: Requires valid API key in `X-API-Key` header
+
+    **Rate Limit**: Each transaction counts as one request against the
+    per-minute and concurrency limits of `POST /analyze`; a batch larger than
+    a limit only runs when nothing else is counted against the key
+
+    **Request Body**:
+    - transactions: List of transaction data (same shape as `POST /analyze`)
+
+    **Returns**:
+    - results: One analysis result per transaction, in request order
+    - total_transactions: Number of transactions analyzed
+    - processing_time: Batch analysis time in seconds
+    """
+    release = await acquire_request_slot(
+        http_request, api_key, cost=len(request.transactions)
+    )
+    try:
+        logger.info(
+            "Received batch analysis request for %d transactions", len(request.transactions)
+        )
+        return await service.analyze_batch(request)
+
+    except Exception as e:
+        logger.error("Batch analysis failed: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "Batch analysis failed",
+                "message": str(e),
+                "code": "ANALYSIS_ERROR"
+            }
+        )
+    finally:
+        await release()
+
+
+@router.post("/stream")
+async def analyze_transaction_stream(
+    request: AnalysisRequest,
+    http_request: Request,
+    service: AnalysisService = Depends(get_analysis_service),
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Analyze a transaction, streaming results as Server-Sent Events
+
+    **Authentication**: Requires valid API key in `X-API-Key` header
+
+    **Rate Limit**: Same as `POST /analyze`; the slot is held until the
+    stream finishes
+
+    **Request Body**: Same as `POST /analyze`
+
+    **Events**:
+    - `alert`: One compliance alert, sent as soon as it is found
+    - `result`: Final transaction_id, risk_score, citations and processing_time
+    - `error`: Analysis failed after streaming started
+    """
+    logger.info("Received streamed analysis request for %s", request.transaction.company)
+    release = await acquire_request_slot(http_request, api_key)
+    return StreamingResponse(
+        release_after_stream(service.analyze_stream(request), release),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/health")
-async def analysis_health():
+async def analysis_health(request: Request):
     """Check if analysis service is healthy"""
     try:
-        service = AnalysisService()
+        service = get_analysis_service(request)
         return {
             "status": "healthy",
             "service": "analysis",
@@ -1,11 +1,17 @@
 """
 Analysis Service - Integrates RAG Pipeline for Transaction Analysis
 """
+import asyncio
+import secrets
 import time
-import uuid
-from typing import Dict, List
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, AsyncIterator, List, Optional, Tuple
 from datetime import datetime
 import logging
+import numpy as np
+import orjson
 
 from ...models.rag import RAGPipeline, EmbeddingManager
 from ...data.loaders import TransactionDataLoader
@@ -13,6 +19,8 @@ from ...data.validation import validate_transaction_data
 from ..models.schemas import (
     AnalysisRequest,
     AnalysisResponse,
+    BatchAnalysisRequest,
+    BatchAnalysisResponse,
     Alert,
     Citation,
     TransactionData
@@ -20,6 +28,182 @@ from ..models.schemas import (
 
 logger = logging.getLogger("sentinel.api.analysis")
 
+# Rule thresholds
+VOLUME_HIGH = 100_000
+SELL_HIGH = 50_000
+HIGH_ROLES = frozenset({"Director", "Commissioner"})
+
+# Regulations cited by the rules
+RULE_VOLUME = "Internal Policy - Volume Threshold"
+RULE_SELLING = "POJK 30/2016 - Monitoring Required"
+RULE_ROLE = "POJK 33/2014 - Disclosure Required"
+
+# Detection rules, checked in order. Each row is
+# (matches(action, role, volume), mask(actions, roles, volumes) for NumPy
+#  batches, severity, title, rule_violated, describe(action, role, volume))
+RULES = (
+    # Large transaction volume
+    (
+        lambda action, role, volume: volume > VOLUME_HIGH,
+        lambda actions, roles, volumes: volumes > VOLUME_HIGH,
+        "HIGH",
+        "Unusual Volume",
+        RULE_VOLUME,
+        lambda action, role, volume: f"Transaction volume ({volume:,}) exceeds typical threshold"
+    ),
+    # Selling activity (potentially suspicious)
+    (
+        lambda action, role, volume: action == "SELL" and volume > SELL_HIGH,
+        lambda actions, roles, volumes: (actions == "SELL") & (volumes > SELL_HIGH),
+        "MEDIUM",
+        "Significant Insider Selling",
+        RULE_SELLING,
+        lambda action, role, volume: f"{role} sold {volume:,} shares"
+    ),
+    # Director/Commissioner activity
+    (
+        lambda action, role, volume: role in HIGH_ROLES,
+        lambda actions, roles, volumes: np.isin(roles, list(HIGH_ROLES)),
+        "MEDIUM",
+        "High-Level Insider Activity",
+        RULE_ROLE,
+        lambda action, role, volume: f"{role} transaction recorded"
+    ),
+)
+
+# Risk contribution per alert severity (unknown severities count as MEDIUM)
+SEVERITY_WEIGHTS = MappingProxyType({
+    "CRITICAL": 1.0,
+    "HIGH": 0.75,
+    "MEDIUM": 0.5,
+    "LOW": 0.25
+})
+
+# Distinct (action, role, volume) analyses kept by _compute_analysis
+ANALYSIS_CACHE_SIZE = 4096
+
+
+def new_transaction_id() -> str:
+    """Opaque random transaction ID (96 bits, 16 URL-safe characters)"""
+    return secrets.token_urlsafe(12)
+
+
+def _sse_event(event: str, data: Any) -> bytes:
+    """Encode one Server-Sent Event (orjson serializes dicts and dataclasses)"""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+@dataclass(frozen=True, slots=True)
+class _Alert:
+    """
+    Internal alert produced by the rules
+
+    Rule output is valid by construction, so it is carried as a plain
+    dataclass and only turned into the Pydantic Alert for the response.
+    """
+    severity: str
+    title: str
+    description: str
+    rule_violated: Optional[str] = None
+
+    def to_model(self) -> Alert:
+        """Build the response model without re-running validation"""
+        return Alert.model_construct(
+            severity=self.severity,
+            title=self.title,
+            description=self.description,
+            rule_violated=self.rule_violated
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _Citation:
+    """Internal regulatory citation (see _Alert)"""
+    source: str
+    article: str
+    text: str
+
+    def to_model(self) -> Citation:
+        """Build the response model without re-running validation"""
+        return Citation.model_construct(
+            source=self.source,
+            article=self.article,
+            text=self.text
+        )
+
+
+def _rule_citation(rule_violated: str) -> _Citation:
+    """Citation for a "<source> - <reason>" rule string"""
+    return _Citation(
+        source=rule_violated.split("-")[0].strip(),
+        article="Article 1",  # TODO: Extract from RAG
+        text="[Citation text would come from RAG pipeline]"
+    )
+
+
+# Citations for the built-in rules, built once; other rule strings (e.g. from
+# RAG alerts later) fall back to _rule_citation
+RULE_TO_CITATION = MappingProxyType({
+    rule: _rule_citation(rule) for rule in (RULE_VOLUME, RULE_SELLING, RULE_ROLE)
+})
+
+
+def _analyze_transaction(action: str, insider_role: str, volume: int) -> List[_Alert]:
+    """
+    Analyze transaction and generate alerts
+
+    Rule-based detection only; RAG analysis needs the service's pipeline
+    """
+    alerts = [
+        _Alert(severity, title, describe(action, insider_role, volume), rule_violated)
+        for matches, _, severity, title, rule_violated, describe in RULES
+        if matches(action, insider_role, volume)
+    ]
+
+    # TODO: Add RAG-based analysis when vectorstore is ready
+    # if self.rag:
+    #     rag_alerts = self._rag_analysis(txn)
+    #     alerts.extend(rag_alerts)
+
+    return alerts
+
+
+def _calculate_risk_score(alerts: List[_Alert]) -> float:
+    """Calculate risk score based on alerts"""
+    if not alerts:
+        return 0.0
+
+    total_score = sum(SEVERITY_WEIGHTS.get(alert.severity, 0.5) for alert in alerts)
+    # Normalize to 0-1
+    return min(total_score / len(alerts), 1.0)
+
+
+def _get_citations(alerts: List[_Alert]) -> List[_Citation]:
+    """Get regulatory citations for alerts (deduplicated, in alert order)"""
+    citations = (
+        RULE_TO_CITATION.get(alert.rule_violated) or _rule_citation(alert.rule_violated)
+        for alert in alerts
+        if alert.rule_violated
+    )
+    return list(dict.fromkeys(citations))
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _compute_analysis(
+    action: str,
+    insider_role: str,
+    volume: int
+) -> Tuple[Tuple[_Alert, ...], float, Tuple[_Citation, ...]]:
+    """
+    Run the rules for one set of transaction features
+
+    The result depends only on (action, insider_role, volume), so it is
+    cached per process as immutable tuples; callers copy them into the
+    response.
+    """
+    alerts = _analyze_transaction(action, insider_role, volume)
+    return tuple(alerts), _calculate_risk_score(alerts), tuple(_get_citations(alerts))
+
 
 class AnalysisService:
     """
@@ -33,7 +217,7 @@ class AnalysisService:
             self.rag = self._initialize_rag()
             logger.info("AnalysisService initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize AnalysisService: {e}")
+            logger.error("Failed to initialize AnalysisService: %s", e)
             raise
 
     def _initialize_rag(self) -> RAGPipeline:
@@ -43,11 +227,24 @@ class AnalysisService:
         Note: In production, load pre-built vectorstore
         For now, we'll create a minimal one
         """
+        # Already loaded - never rebuild the pipeline for an existing service
+        if getattr(self, "rag", None) is not None:
+            return self.rag
+
         # TODO: Load pre-built vectorstore with regulations
         # For now, return None and handle gracefully
         logger.warning("RAG pipeline not fully initialized - using mock mode")
         return None
 
+    async def start(self):
+        """Warm up the RAG pipeline, if any, before serving (app startup)"""
+        if self.rag is not None:
+            # Load the model and cache the system prompt before the first request
+            await asyncio.to_thread(self.rag.warm_up)
+
+    async def stop(self):
+        """Release service resources (app shutdown)"""
+
     async def analyze(self, request: AnalysisRequest) -> AnalysisResponse:
         """
         Analyze transaction for compliance violations
@@ -59,117 +256,169 @@ class AnalysisService:
             Analysis response with alerts and citations
         """
         start_time = time.time()
-        transaction_id = str(uuid.uuid4())
+        transaction_id = new_transaction_id()
 
-        logger.info(f"Starting analysis for transaction {transaction_id}")
+        logger.info("Starting analysis for transaction %s", transaction_id)
 
         try:
             # Extract transaction data
             txn = request.transaction
 
-            # Perform analysis
-            alerts = self._analyze_transaction(txn)
-            risk_score = self._calculate_risk_score(alerts)
-            citations = self._get_citations(alerts)
+            # Perform analysis. Called directly: the rules are cheap, so a
+            # BatchQueue hop only adds latency until a batched RAG/LLM
+            # backend is wired in
+            alerts, risk_score, citations = _compute_analysis(
+                txn.action, txn.insider_role, txn.volume
+            )
 
             processing_time = time.time() - start_time
 
             logger.info(
-                f"Analysis complete for {transaction_id}: "
-                f"{len(alerts)} alerts, risk={risk_score:.2f}, "
-                f"time={processing_time:.2f}s"
+                "Analysis complete for %s: %d alerts, risk=%.2f, time=%.2fs",
+                transaction_id, len(alerts), risk_score, processing_time
             )
 
             return AnalysisResponse(
                 transaction_id=transaction_id,
-                alerts=alerts,
+                alerts=[alert.to_model() for alert in alerts],
                 risk_score=risk_score,
-                citations=citations,
+                citations=[citation.to_model() for citation in citations],
                 processing_time=processing_time,
-                timestamp=datetime.now()
+                timestamp=datetime.fromtimestamp(start_time)
             )
 
         except Exception as e:
-            logger.error(f"Analysis failed for {transaction_id}: {e}")
+            logger.error("Analysis failed for %s: %s", transaction_id, e)
             raise
 
-    def _analyze_transaction(self, txn: TransactionData) -> List[Alert]:
+    async def analyze_stream(self, request: AnalysisRequest) -> AsyncIterator[bytes]:
         """
-        Analyze transaction and generate alerts
+        Analyze transaction, streaming results as Server-Sent Events
 
-        Uses rule-based detection + RAG (when available)
+        Emits an `alert` event per alert as soon as it is available, then a
+        final `result` event with risk score, citations and timing. Failures
+        after streaming has started are reported as an `error` event.
+
+        Args:
+            request: Analysis request with transaction data
+
+        Yields:
+            Encoded SSE events
         """
-        alerts = []
-
-        # Rule 1: Large transaction volume
-        if txn.volume > 100000:
-            alerts.append(Alert(
-                severity="HIGH",
-                title="Unusual Volume",
-                description=f"Transaction volume ({txn.volume:,}) exceeds typical threshold",
-                rule_violated="Internal Policy - Volume Threshold"
-            ))
-
-        # Rule 2: Selling activity (potentially suspicious)
-        if txn.action == "SELL" and txn.volume > 50000:
-            alerts.append(Alert(
-                severity="MEDIUM",
-                title="Significant Insider Selling",
-                description=f"{txn.insider_role} sold {txn.volume:,} shares",
-                rule_violated="POJK 30/2016 - Monitoring Required"
-            ))
-
-        # Rule 3: Director/Commissioner activity
-        if txn.insider_role in ["Director", "Commissioner"]:
-            alerts.append(Alert(
-                severity="MEDIUM",
-                title="High-Level Insider Activity",
-                description=f"{txn.insider_role} transaction recorded",
-                rule_violated="POJK 33/2014 - Disclosure Required"
-            ))
-
-        # TODO: Add RAG-based analysis when vectorstore is ready
-        # if self.rag:
-        #     rag_alerts = self._rag_analysis(txn)
-        #     alerts.extend(rag_alerts)
-
-        return alerts
-
-    def _calculate_risk_score(self, alerts: List[Alert]) -> float:
-        """Calculate risk score based on alerts"""
-        if not alerts:
-            return 0.0
-
-        severity_weights = {
-            "CRITICAL": 1.0,
-            "HIGH": 0.75,
-            "MEDIUM": 0.5,
-            "LOW": 0.25
-        }
-
-        total_score = sum(severity_weights.get(alert.severity, 0.5) for alert in alerts)
-        # Normalize to 0-1
-        return min(total_score / len(alerts), 1.0)
-
-    def _get_citations(self, alerts: List[Alert]) -> List[Citation]:
-        """Get regulatory citations for alerts"""
-        citations = []
-
-        for alert in alerts:
-            if alert.rule_violated:
-                citations.append(Citation(
-                    source=alert.rule_violated.split("-")[0].strip(),
-                    article="Article 1",  # TODO: Extract from RAG
-                    text="[Citation text would come from RAG pipeline]"
-                ))
-
-        # Remove duplicates
-        seen = set()
-        unique_citations = []
-        for citation in citations:
-            key = (citation.source, citation.article)
-            if key not in seen:
-                seen.add(key)
-                unique_citations.append(citation)
-
-        return unique_citations
+        start_time = time.time()
+        transaction_id = new_transaction_id()
+
+        logger.info("Starting streamed analysis for transaction %s", transaction_id)
+
+        try:
+            txn = request.transaction
+            alerts, risk_score, citations = _compute_analysis(
+                txn.action, txn.insider_role, txn.volume
+            )
+
+            for alert in alerts:
+                yield _sse_event("alert", alert)
+
+            yield _sse_event("result", {
+                "transaction_id": transaction_id,
+                "risk_score": risk_score,
+                "citations": citations,
+                "processing_time": time.time() - start_time,
+                "timestamp": datetime.fromtimestamp(start_time)
+            })
+
+        except Exception as e:
+            logger.error("Streamed analysis failed for %s: %s", transaction_id, e)
+            yield _sse_event("error", {
+                "error": "Analysis failed",
+                "message": str(e),
+                "code": "ANALYSIS_ERROR"
+            })
+
+    async def analyze_batch(self, request: BatchAnalysisRequest) -> BatchAnalysisResponse:
+        """
+        Analyze many transactions at once
+
+        Rules are evaluated as NumPy masks over the whole batch, risk scores
+        are computed from the masks, and alerts are only built for
+        transactions that actually triggered a rule.
+
+        Args:
+            request: Batch analysis request
+
+        Returns:
+            One analysis result per transaction, in request order
+        """
+        start_time = time.time()
+        txns = request.transactions
+        n = len(txns)
+
+        logger.info("Starting batch analysis of %d transactions", n)
+
+        volumes = np.fromiter((t.volume for t in txns), dtype=np.int64, count=n)
+        actions = np.array([t.action for t in txns])
+        roles = np.array([t.insider_role for t in txns])
+
+        # One boolean row per rule, in RULES order
+        masks = np.stack([mask(actions, roles, volumes) for _, mask, *_ in RULES])
+        weights = np.array([SEVERITY_WEIGHTS[severity] for _, _, severity, *_ in RULES])
+
+        # Mean severity weight over the alerts each transaction raised
+        alert_counts = masks.sum(axis=0)
+        weight_sums = weights @ masks
+        risk_scores = np.minimum(
+            np.divide(weight_sums, alert_counts, out=np.zeros(n), where=alert_counts > 0),
+            1.0
+        )
+
+        alerts_per_txn = [[] for _ in range(n)]
+        for i in np.flatnonzero(alert_counts):
+            txn = txns[i]
+            alerts_per_txn[i] = [
+                _Alert(
+                    severity,
+                    title,
+                    describe(txn.action, txn.insider_role, txn.volume),
+                    rule_violated
+                )
+                for triggered, (_, _, severity, title, rule_violated, describe) in zip(
+                    masks[:, i], RULES
+                )
+                if triggered
+            ]
+
+        timestamp = datetime.fromtimestamp(start_time)
+        processing_time = time.time() - start_time
+        results = [
+            AnalysisResponse(
+                transaction_id=new_transaction_id(),
+                alerts=[alert.to_model() for alert in alerts],
+                risk_score=float(risk_score),
+                citations=[citation.to_model() for citation in _get_citations(alerts)],
+                processing_time=processing_time,
+                timestamp=timestamp
+            )
+            for alerts, risk_score in zip(alerts_per_txn, risk_scores)
+        ]
+
+        logger.info(
+            "Batch analysis complete: %d transactions, %d alerts, time=%.3fs",
+            n, alert_counts.sum(), processing_time
+        )
+
+        return BatchAnalysisResponse(
+            results=results,
+            total_transactions=n,
+            processing_time=time.time() - start_time
+        )
+
+
+@lru_cache(maxsize=1)
+def get_default_analysis_service() -> AnalysisService:
+    """
+    Process-wide AnalysisService instance
+
+    Used by the API lifespan and as a fallback for CLI/test use, so the RAG
+    pipeline is initialized once per process rather than once per request.
+    """
+    return AnalysisService()
@@ -0,0 +1,120 @@
+"""
+Micro-batching queue - coalesces concurrent requests into one handler call
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional
+
+logger = logging.getLogger("sentinel.api.batching")
+
+
+class BatchQueue:
+    """
+    Continuous-batching queue for async request handlers
+
+    Requests submitted while a batch is being processed are collected and
+    handed to the handler together as the next batch, so an expensive
+    per-call backend (LLM, embedding model) is invoked once per batch
+    instead of once per request.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch: int = 16,
+        max_wait_ms: float = 0.0,
+    ):
+        """
+        Initialize batch queue
+
+        Args:
+            handler: Async callable mapping a list of items to a list of results
+                (same length and order)
+            max_batch: Maximum items per handler call
+            max_wait_ms: Extra time to wait for a batch to fill after its first
+                item; 0 only takes items that are already queued
+        """
+        self.handler = handler
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background batching task is active"""
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        """Start the batching task on the current event loop"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop batching and fail any requests still waiting or in flight"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Batch queue stopped"))
+
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its result"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect_batch(self, batch: List):
+        """Wait for one item, then gather more into batch up to max_batch / max_wait"""
+        batch.append(await self._queue.get())
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+    async def _run(self):
+        """Background loop: collect a batch, run the handler, resolve futures"""
+        while True:
+            # Filled in place so items already taken off the queue are still
+            # failed if the task is cancelled mid-batch
+            batch = []
+            try:
+                await self._collect_batch(batch)
+                items = [item for item, _ in batch]
+                results = await self.handler(items)
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(RuntimeError("Batch queue stopped"))
+                raise
+            except Exception as e:
+                logger.error("Batch of %d failed: %s", len(batch), e)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
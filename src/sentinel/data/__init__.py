@@ -0,0 +1,6 @@
+import pandas as pd
+
+# Copy-on-Write (always on from pandas 3.0): the data helpers take shallow
+# copies of their inputs and rely on CoW instead of up-front deep copies
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
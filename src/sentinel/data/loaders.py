@@ -3,14 +3,101 @@ SENTINEL Data Loading Utilities
 Professional data loaders with validation and error handling
 """
 
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Optional, Dict, List
 import logging
+import os
 from datetime import datetime
 
+# Multithreaded C++ CSV parser when available
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    pa = None
+    CSV_ENGINE = 'c'
+
 logger = logging.getLogger(__name__)
 
+# Known transaction column types - skips type inference and uses the
+# narrowest types the validation ranges allow (shared with validation.py):
+# volume < 10M and price < 100k fit int32, days_to_earnings <= 90 fits int8;
+# low-cardinality labels are categoricals
+TRANSACTION_DTYPES = {
+    'transaction_id': str,
+    'company': 'category',
+    'insider_name': str,
+    'insider_role': 'category',
+    'action': 'category',
+    'volume': 'int32',
+    'price': 'int32',
+    'total_value': 'int64',
+    'days_to_earnings': 'int8',
+    'is_suspicious': bool,
+    'violation_type': str,
+}
+TRANSACTION_DATE_COLUMNS = ['date']
+
+# Numeric/flag columns are parsed (and range-checked by validation) as nullable
+# Int64/boolean, then cast to TRANSACTION_DTYPES once they hold no missing or
+# out-of-range values: a missing value would fail the read instead of being
+# reported, and parsing or casting straight into a narrow type silently wraps
+# out-of-range values (300 -> 44 for int8)
+TRANSACTION_PARSE_DTYPES = {
+    **TRANSACTION_DTYPES,
+    'volume': 'Int64',
+    'price': 'Int64',
+    'total_value': 'Int64',
+    'days_to_earnings': 'Int64',
+    'is_suspicious': 'boolean',
+}
+_NARROWED_COLUMNS = [
+    col for col in TRANSACTION_DTYPES if TRANSACTION_PARSE_DTYPES[col] != TRANSACTION_DTYPES[col]
+]
+
+
+def _latest_file(directory: Path, prefix: str, suffix: str) -> Optional[Path]:
+    """
+    Most recently modified file named prefix*suffix, or None
+
+    Single os.scandir pass: names come from the directory listing and each
+    entry caches its own stat result, instead of glob + a stat per path.
+    """
+    latest, latest_mtime = None, -1.0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(suffix) and entry.is_file():
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest, latest_mtime = entry.path, mtime
+    return Path(latest) if latest is not None else None
+
+
+def narrow_transaction_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast columns parsed with TRANSACTION_PARSE_DTYPES to TRANSACTION_DTYPES
+
+    Columns with missing values or values outside the target type's range
+    are left as they are, so validation still sees (and reports) them.
+    """
+    narrowed = {}
+    for col in _NARROWED_COLUMNS:
+        if col not in df.columns or df[col].hasnans:
+            continue
+        dtype = TRANSACTION_DTYPES[col]
+        if dtype is not bool:
+            info = np.iinfo(dtype)
+            if not df[col].between(info.min, info.max).all():
+                continue
+        narrowed[col] = dtype
+    return df.astype(narrowed) if narrowed else df
+
 
 class TransactionDataLoader:
     """Load and validate transaction data with professional error handling"""
@@ -21,13 +108,22 @@ class TransactionDataLoader:
         if not self.data_dir.exists():
             raise FileNotFoundError(f"Data directory not found: {self.data_dir}")
 
+        # Resolved once; with the trailing separator a prefix test is a
+        # containment test (no sibling like "transactions_old" can match)
+        self._resolved_root = os.path.join(os.path.realpath(self.data_dir), '')
+
     def load_latest_synthetic(self) -> pd.DataFrame:
         """Load the most recent synthetic transaction data"""
         pattern = "synthetic_transactions_*.csv"
-        files = list(self.data_dir.glob(pattern))
+
+        # Get most recent file
+        try:
+            latest_file = _latest_file(self.data_dir, "synthetic_transactions_", ".csv")
+        except OSError as e:
+            raise RuntimeError(f"Error accessing file metadata: {e}")
 
         # FIX #1: Better error handling for missing files
-        if not files:
+        if latest_file is None:
             raise FileNotFoundError(
                 f"No synthetic data files found in {self.data_dir}\n\n"
                 f"📊 To generate data, run:\n"
@@ -35,20 +131,15 @@ class TransactionDataLoader:
                 f"Or place CSV files matching '{pattern}' in: {self.data_dir}"
             )
 
-        # Get most recent file
-        try:
-            latest_file = max(files, key=lambda p: p.stat().st_mtime)
-        except (OSError, ValueError) as e:
-            raise RuntimeError(f"Error accessing file metadata: {e}")
-
         logger.info(f"Loading: {latest_file.name}")
-        df = pd.read_csv(latest_file)
+        df = self._read_csv(latest_file)
 
         # Basic validation
         self._validate_schema(df)
 
         logger.info(f"Loaded {len(df)} transactions")
-        logger.info(f"Suspicious: {df['is_suspicious'].sum()} ({df['is_suspicious'].mean()*100:.1f}%)")
+        suspicious = df['is_suspicious']
+        logger.info(f"Suspicious: {suspicious.sum()} ({suspicious.mean()*100:.1f}%)")
 
         return df
 
@@ -66,8 +157,8 @@ class TransactionDataLoader:
 
         # Ensure resolved path is within data_dir (additional safety check)
         try:
-            resolved_path = filepath.resolve()
-            if not resolved_path.is_relative_to(self.data_dir.resolve()):
+            resolved_path = os.path.realpath(filepath)
+            if not os.path.join(resolved_path, '').startswith(self._resolved_root):
                 raise ValueError(
                     f"Security violation: File must be within {self.data_dir}"
                 )
@@ -81,11 +172,35 @@ class TransactionDataLoader:
             )
 
         logger.info(f"Loading: {filename}")
-        df = pd.read_csv(filepath)
+        df = self._read_csv(filepath)
         self._validate_schema(df)
 
         return df
 
+    @staticmethod
+    def _read_csv(path: Path) -> pd.DataFrame:
+        """
+        Read a transaction CSV with the fastest available parser
+
+        Missing columns and out-of-range values are left for _validate_schema
+        and validate_transaction_data to report.
+
+        Raises:
+            ValueError: If a value can't be parsed as its column's type
+        """
+        columns = pd.read_csv(path, nrows=0).columns
+        try:
+            df = pd.read_csv(
+                path,
+                engine=CSV_ENGINE,
+                dtype=TRANSACTION_PARSE_DTYPES,
+                parse_dates=[col for col in TRANSACTION_DATE_COLUMNS if col in columns]
+            )
+        except ValueError as e:  # includes pyarrow's ArrowInvalid
+            raise ValueError(f"Could not parse {path.name}: {e}") from e
+
+        return narrow_transaction_dtypes(df)
+
     def _validate_schema(self, df: pd.DataFrame) -> None:
         """Validate that DataFrame has required columns"""
         required_columns = [
@@ -125,17 +240,23 @@ class TransactionDataLoader:
         assert abs(train_ratio + val_ratio + test_ratio - 1.0) < 0.01, \
             "Ratios must sum to 1.0"
 
-        # Sort by date for temporal split
-        df_sorted = df.sort_values(sort_by).reset_index(drop=True)
-
-        n = len(df_sorted)
+        n = len(df)
         train_end = int(n * train_ratio)
         val_end = train_end + int(n * val_ratio)
 
+        # Temporal split without a full sort: partition around the two
+        # boundary positions in O(n); rows keep their original order
+        # within each split
+        kth = [k for k in (train_end, val_end) if k < n]
+        order = np.argpartition(df[sort_by].to_numpy(), kth) if kth else np.arange(n)
+        order = np.concatenate([np.sort(part) for part in np.split(order, [train_end, val_end])])
+        df_sorted = df.iloc[order].reset_index(drop=True)
+
+        # Copy-on-Write slices - nothing is copied unless a split is modified
         splits = {
-            'train': df_sorted.iloc[:train_end].copy(),
-            'val': df_sorted.iloc[train_end:val_end].copy(),
-            'test': df_sorted.iloc[val_end:].copy()
+            'train': df_sorted.iloc[:train_end],
+            'val': df_sorted.iloc[train_end:val_end],
+            'test': df_sorted.iloc[val_end:]
         }
 
         logger.info(f"Split sizes - Train: {len(splits['train'])}, "
@@ -146,7 +267,8 @@ class TransactionDataLoader:
     def get_feature_matrix(
         self,
         df: pd.DataFrame,
-        feature_cols: Optional[List[str]] = None
+        feature_cols: Optional[List[str]] = None,
+        as_numpy: bool = False
     ) -> tuple:
         """
         Extract feature matrix X and target y
@@ -154,6 +276,8 @@ class TransactionDataLoader:
         Args:
             df: Input DataFrame
             feature_cols: Columns to use as features (default: predefined list)
+            as_numpy: Return a C-contiguous float32 ndarray X and bool ndarray y
+                (what most model libraries consume) instead of pandas objects
 
         Returns:
             (X, y) tuple
@@ -170,21 +294,40 @@ class TransactionDataLoader:
         if missing:
             raise ValueError(f"Missing feature columns: {missing}")
 
-        X = df[feature_cols].copy()
-        y = df['is_suspicious'].copy()
+        if as_numpy:
+            # Single conversion pass, half the bytes of float64
+            X = np.ascontiguousarray(df[feature_cols].to_numpy(dtype=np.float32))
+            y = df['is_suspicious'].to_numpy(dtype=np.bool_)
+            distribution = dict(zip((False, True), np.bincount(y, minlength=2).tolist()))
+        else:
+            # Column selections are Copy-on-Write - no extra copies
+            X = df[feature_cols]
+            y = df['is_suspicious']
+            distribution = y.value_counts().to_dict()
 
         logger.info(f"Feature matrix shape: {X.shape}")
-        logger.info(f"Target distribution: {y.value_counts().to_dict()}")
+        logger.info(f"Target distribution: {distribution}")
 
         return X, y
 
 
+# Columns written by scripts/data/scrape_news.py
+NEWS_COLUMNS = ['url', 'title', 'content', 'date', 'source', 'keyword', 'scraped_at']
+
+
 class NewsDataLoader:
     """Load and validate news article data"""
 
-    def __init__(self, data_dir: str = "data/raw/news"):
+    def __init__(self, data_dir: str = "data/raw/news", max_workers: Optional[int] = None):
+        """
+        Args:
+            data_dir: Directory with scraped article CSVs
+            max_workers: Threads for reading files in parallel
+                (default: one per file, up to the CPU count)
+        """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
 
     def load_articles(self, source: Optional[str] = None) -> pd.DataFrame:
         """
@@ -208,17 +351,46 @@ class NewsDataLoader:
             logger.info("Run: python scripts/data/scrape_news.py")
             return pd.DataFrame()
 
-        # Load all matching files
-        dfs = []
-        for f in files:
-            df = pd.read_csv(f, encoding='utf-8-sig')
-            dfs.append(df)
-
-        combined = pd.concat(dfs, ignore_index=True)
+        if pa is not None:
+            combined = self._read_arrow(files)
+        else:
+            combined = pd.concat(
+                self._map_files(partial(pd.read_csv, encoding='utf-8-sig'), files),
+                ignore_index=True
+            )
         logger.info(f"Loaded {len(combined)} articles from {len(files)} files")
 
         return combined
 
+    def _map_files(self, read, files: List[Path]) -> List:
+        """
+        Read files on a thread pool, results in file order
+
+        The CSV parsers release the GIL, so reading one file overlaps with
+        parsing the others.
+        """
+        max_workers = self.max_workers or min(len(files), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(read, files))
+
+    def _read_arrow(self, files: List[Path]) -> pd.DataFrame:
+        """Read files as Arrow tables and convert to pandas once at the end"""
+        # Article text can span lines; every field is text (like the scraper
+        # writes it) and empty fields become missing values, as with pandas
+        parse_options = pacsv.ParseOptions(newlines_in_values=True)
+        convert_options = pacsv.ConvertOptions(
+            column_types={col: pa.string() for col in NEWS_COLUMNS},
+            strings_can_be_null=True
+        )
+        tables = self._map_files(
+            partial(pacsv.read_csv, parse_options=parse_options, convert_options=convert_options),
+            files
+        )
+
+        # Files with differing columns are unified (missing columns -> null)
+        combined = pa.concat_tables(tables, promote_options="default")
+        return combined.to_pandas(split_blocks=True, self_destruct=True)
+
 
 class RegulationDataLoader:
     """Load and process regulatory documents (PDFs)"""
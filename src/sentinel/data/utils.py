@@ -8,8 +8,24 @@ import numpy as np
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime, timedelta
 import json
+import types
+import warnings
+from functools import lru_cache
 from pathlib import Path
 
+# Optional JIT for detect_outliers(use_jit=True) (NumPy path without it)
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# Optional fast JSON for data profiles (stdlib json fallback without it)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def add_temporal_features(df: pd.DataFrame, date_col: str = 'date') -> pd.DataFrame:
     """
@@ -23,17 +39,47 @@ def add_temporal_features(df: pd.DataFrame, date_col: str = 'date') -> pd.DataFr
     - is_month_end
     - year
     """
-    df = df.copy()
-    df[date_col] = pd.to_datetime(df[date_col])
-
-    df['day_of_week'] = df[date_col].dt.dayofweek
-    df['month'] = df[date_col].dt.month
-    df['quarter'] = df[date_col].dt.quarter
-    df['is_quarter_end'] = df[date_col].dt.is_quarter_end
-    df['is_month_end'] = df[date_col].dt.is_month_end
-    df['year'] = df[date_col].dt.year
+    df = df.copy(deep=False)  # CoW: new columns never touch the caller's frame
+    df[date_col] = dates = pd.to_datetime(df[date_col])
+
+    # Timezone-aware or missing dates need pandas' calendar handling
+    if dates.dt.tz is not None or dates.hasnans:
+        return _with_columns(df, {
+            'day_of_week': dates.dt.dayofweek,
+            'month': dates.dt.month,
+            'quarter': dates.dt.quarter,
+            'is_quarter_end': dates.dt.is_quarter_end,
+            'is_month_end': dates.dt.is_month_end,
+            'year': dates.dt.year,
+        })
+
+    # Truncate the datetime64 buffer once, derive every field from it in NumPy
+    days = dates.to_numpy().astype('datetime64[D]')
+    months = days.astype('datetime64[M]')
+    month = (months.astype(np.int64) % 12 + 1).astype(np.int32)
+    is_month_end = (days + 1).astype('datetime64[M]') != months
+    # 1970-01-01 was a Thursday
+    day_of_week = ((days.astype(np.int64) + 3) % 7).astype(np.int32)
+
+    return _with_columns(df, {
+        'day_of_week': day_of_week,
+        'month': month,
+        'quarter': (month - 1) // 3 + 1,
+        'is_quarter_end': is_month_end & (month % 3 == 0),
+        'is_month_end': is_month_end,
+        'year': (days.astype('datetime64[Y]').astype(np.int64) + 1970).astype(np.int32),
+    })
+
+
+def _with_columns(df: pd.DataFrame, new_cols: Dict) -> pd.DataFrame:
+    """
+    df plus new_cols, attached with a single concat
 
-    return df
+    Avoids fragmenting the frame with one block insert per feature;
+    existing columns with the same names are replaced.
+    """
+    new = pd.DataFrame(new_cols, index=df.index)
+    return pd.concat([df.drop(columns=new.columns, errors='ignore'), new], axis=1)
 
 
 def add_statistical_features(
@@ -52,28 +98,31 @@ def add_statistical_features(
     Returns:
         DataFrame with added features
     """
-    df = df.copy()
+    # Built-in group aggregations run in compiled code - no Python call per group
+    grouped = df.groupby(group_by, sort=False, observed=True)
 
+    features = {}
     for col in numeric_cols:
+        gb = grouped[col]
+
         # Z-score (normalized by group)
         # FIX #2: Return NaN instead of 0 when std=0 to indicate no variation
-        df[f'{col}_zscore'] = df.groupby(group_by)[col].transform(
-            lambda x: (x - x.mean()) / x.std() if x.std() > 0 else float('nan')
-        )
+        group_mean = gb.transform('mean')
+        group_std = gb.transform('std')
+        features[f'{col}_zscore'] = (df[col] - group_mean) / group_std.mask(group_std.eq(0))
 
         # Percentile rank
-        df[f'{col}_percentile'] = df.groupby(group_by)[col].transform(
-            lambda x: x.rank(pct=True)
-        )
+        features[f'{col}_percentile'] = gb.rank(pct=True)
 
-    return df
+    return _with_columns(df, features)
 
 
 def detect_outliers(
     df: pd.DataFrame,
     columns: List[str],
     method: str = 'iqr',
-    threshold: float = 1.5
+    threshold: float = 1.5,
+    use_jit: bool = False
 ) -> pd.DataFrame:
     """
     Detect outliers using IQR or Z-score method
@@ -83,28 +132,84 @@ def detect_outliers(
         columns: Columns to check for outliers
         method: 'iqr' or 'zscore'
         threshold: IQR multiplier or z-score threshold
+        use_jit: Use the parallel numba kernel (if numba is installed). Only
+            worth it for many calls on large frames in one process: the
+            first call compiles the kernel (seconds; cached on disk after)
 
     Returns:
         DataFrame with boolean outlier columns
     """
-    df = df.copy()
+    if method not in ('iqr', 'zscore'):
+        return df.copy(deep=False)
 
-    for col in columns:
-        if method == 'iqr':
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
+    # One contiguous float matrix, all columns checked in a single pass
+    X = np.ascontiguousarray(df[columns].to_numpy(dtype=np.float64, na_value=np.nan))
+    if use_jit and njit is not None:
+        mask = np.empty(X.shape, dtype=np.bool_)
+        _compiled_outlier_kernel()(X, method == 'iqr', float(threshold), mask)
+    else:
+        mask = _outlier_mask_numpy(X, method, threshold)
+
+    return _with_columns(df, {f'{col}_is_outlier': mask[:, j] for j, col in enumerate(columns)})
 
-            lower_bound = Q1 - threshold * IQR
-            upper_bound = Q3 + threshold * IQR
 
-            df[f'{col}_is_outlier'] = (df[col] < lower_bound) | (df[col] > upper_bound)
+def _outlier_mask_numpy(X: np.ndarray, method: str, threshold: float) -> np.ndarray:
+    """Column-wise outlier mask (NaN-aware, same statistics as pandas)"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if method == 'iqr':
+            q1, q3 = np.nanpercentile(X, [25, 75], axis=0)
+            iqr = q3 - q1
+            return (X < q1 - threshold * iqr) | (X > q3 + threshold * iqr)
+
+        z_scores = np.abs((X - np.nanmean(X, axis=0)) / np.nanstd(X, axis=0, ddof=1))
+        return z_scores > threshold
+
+
+def _outlier_mask_kernel(X, use_iqr, threshold, out):
+    """Write the outlier mask of each column of X into out (columns in parallel)"""
+    n_rows, n_cols = X.shape
+    for j in prange(n_cols):
+        col = X[:, j]
+        valid = col[~np.isnan(col)]
+        if valid.size == 0:
+            out[:, j] = False
+            continue
+
+        if use_iqr:
+            q1 = np.percentile(valid, 25)
+            q3 = np.percentile(valid, 75)
+            lower = q1 - threshold * (q3 - q1)
+            upper = q3 + threshold * (q3 - q1)
+            for i in range(n_rows):
+                out[i, j] = col[i] < lower or col[i] > upper
+        else:
+            mean = valid.mean()
+            std = np.sqrt(((valid - mean) ** 2).sum() / (valid.size - 1))
+            for i in range(n_rows):
+                out[i, j] = abs((col[i] - mean) / std) > threshold
+
 
-        elif method == 'zscore':
-            z_scores = np.abs((df[col] - df[col].mean()) / df[col].std())
-            df[f'{col}_is_outlier'] = z_scores > threshold
+@lru_cache(maxsize=None)
+def _compiled_outlier_kernel():
+    """
+    JIT-compile _outlier_mask_kernel on first use
 
-    return df
+    Compiled lazily so importing this module never pays for numba. The
+    explicit signature compiles exactly one specialization, and cache=True
+    lets later processes load it from __pycache__ instead of recompiling.
+    No fastmath: NaN handling must match pandas (missing values never flag).
+    """
+    # Cached code re-imports its module by name on load, so this file imported
+    # as src.sentinel.data.utils and as sentinel.data.utils needs one cache
+    # entry each; numba names cache files after the function's qualname
+    kernel = types.FunctionType(_outlier_mask_kernel.__code__, globals())
+    kernel.__qualname__ = f"{__name__}._outlier_mask_kernel"
+    return njit(
+        'void(float64[:, ::1], boolean, float64, boolean[:, ::1])',
+        parallel=True,
+        cache=True,
+        error_model='numpy'
+    )(kernel)
 
 
 def create_lag_features(
@@ -125,16 +230,15 @@ def create_lag_features(
     Returns:
         DataFrame with lag features
     """
-    df = df.copy()
+    # Build the group index once and shift all columns together per lag
+    source = df.groupby(group_by, sort=False, observed=True)[columns] if group_by else df[columns]
+    shifted = {lag: source.shift(lag) for lag in lags}
 
-    for col in columns:
-        for lag in lags:
-            if group_by:
-                df[f'{col}_lag{lag}'] = df.groupby(group_by)[col].shift(lag)
-            else:
-                df[f'{col}_lag{lag}'] = df[col].shift(lag)
-
-    return df
+    return _with_columns(df, {
+        f'{col}_lag{lag}': shifted[lag][col].to_numpy()
+        for col in columns
+        for lag in lags
+    })
 
 
 def create_rolling_features(
@@ -155,23 +259,31 @@ def create_rolling_features(
     Returns:
         DataFrame with rolling features
     """
-    df = df.copy()
-
+    # Roll all columns at once per window; grouped rolling goes through pandas'
+    # compiled path instead of a Python lambda per group. Values are taken by
+    # position so results map back to row order (even with duplicate labels)
+    values = df[columns].reset_index(drop=True)
+    if group_by:
+        values = values.groupby(df[group_by].to_numpy(), sort=False)
+
+    rolled = {}
+    for window in windows:
+        roll = values.rolling(window, min_periods=1)
+        means, stds = roll.mean(), roll.std()
+        if group_by:
+            # Back to row order; rows with a missing group key stay NaN
+            means = means.droplevel(0).reindex(range(len(df)))
+            stds = stds.droplevel(0).reindex(range(len(df)))
+        rolled[window] = means, stds
+
+    features = {}
     for col in columns:
         for window in windows:
-            if group_by:
-                grouped = df.groupby(group_by)[col]
-                df[f'{col}_rolling_mean_{window}'] = grouped.transform(
-                    lambda x: x.rolling(window, min_periods=1).mean()
-                )
-                df[f'{col}_rolling_std_{window}'] = grouped.transform(
-                    lambda x: x.rolling(window, min_periods=1).std()
-                )
-            else:
-                df[f'{col}_rolling_mean_{window}'] = df[col].rolling(window, min_periods=1).mean()
-                df[f'{col}_rolling_std_{window}'] = df[col].rolling(window, min_periods=1).std()
+            means, stds = rolled[window]
+            features[f'{col}_rolling_mean_{window}'] = means[col].to_numpy()
+            features[f'{col}_rolling_std_{window}'] = stds[col].to_numpy()
 
-    return df
+    return _with_columns(df, features)
 
 
 def save_data_profile(df: pd.DataFrame, output_path: str) -> None:
@@ -194,24 +306,62 @@ def save_data_profile(df: pd.DataFrame, output_path: str) -> None:
     # Numeric summaries
     numeric_df = df.select_dtypes(include=[np.number])
     if not numeric_df.empty:
-        profile["numeric_summary"] = numeric_df.describe().to_dict()
+        profile["numeric_summary"] = _describe_numeric(numeric_df)
 
     # Categorical summaries
     categorical_df = df.select_dtypes(include=['object', 'category', 'bool'])
     if not categorical_df.empty:
         profile["categorical_summary"] = {
-            col: df[col].value_counts().head(10).to_dict()
-            for col in categorical_df.columns
+            col: values.value_counts().head(10).to_dict()
+            for col, values in categorical_df.items()
         }
 
     # Save to file
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w') as f:
-        json.dump(profile, f, indent=2, default=str)
+    if orjson is not None:
+        Path(output_path).write_bytes(orjson.dumps(
+            profile,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(profile, f, indent=2, default=str)
 
     print(f"✅ Data profile saved to: {output_path}")
 
 
+def _describe_numeric(numeric_df: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+    """Same statistics as DataFrame.describe(), from one float matrix"""
+    X = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+    count = np.count_nonzero(~np.isnan(X), axis=0)
+
+    # Without missing values the plain reductions apply (partition-based
+    # quantiles instead of nanpercentile's per-column fallback)
+    if count.min() == len(X):
+        mean, std, lo, hi, percentile = np.mean, np.std, np.min, np.max, np.percentile
+    else:
+        mean, std, lo, hi = np.nanmean, np.nanstd, np.nanmin, np.nanmax
+        percentile = np.nanpercentile
+
+    # All-NaN / single-value columns give NaN like describe(), without the warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        stats = {
+            'count': count.astype(np.float64),
+            'mean': mean(X, axis=0),
+            'std': std(X, axis=0, ddof=1),
+            'min': lo(X, axis=0),
+        }
+        stats['25%'], stats['50%'], stats['75%'] = percentile(X, [25, 50, 75], axis=0)
+        stats['max'] = hi(X, axis=0)
+
+    return {
+        col: {name: float(values[j]) for name, values in stats.items()}
+        for j, col in enumerate(numeric_df.columns)
+    }
+
+
 def check_data_quality(df: pd.DataFrame, verbose: bool = True) -> Dict:
     """
     Comprehensive data quality checks
@@ -222,9 +372,10 @@ def check_data_quality(df: pd.DataFrame, verbose: bool = True) -> Dict:
     issues = []
     warnings = []
 
-    # Check for missing values
-    missing = df.isnull().sum()
-    if missing.sum() > 0:
+    # Check for missing values (one scan, reused for the percentage below)
+    missing = df.isna().sum()
+    total_missing = missing.sum()
+    if total_missing > 0:
         issues.append(f"Missing values: {missing[missing > 0].to_dict()}")
 
     # Check for duplicates
@@ -233,7 +384,8 @@ def check_data_quality(df: pd.DataFrame, verbose: bool = True) -> Dict:
         warnings.append(f"Duplicate rows: {n_duplicates}")
 
     # Check for constant columns
-    constant_cols = [col for col in df.columns if df[col].nunique() == 1]
+    n_unique = df.nunique()
+    constant_cols = n_unique.index[n_unique == 1].tolist()
     if constant_cols:
         warnings.append(f"Constant columns: {constant_cols}")
 
@@ -248,7 +400,7 @@ def check_data_quality(df: pd.DataFrame, verbose: bool = True) -> Dict:
         "warnings": warnings,
         "total_rows": len(df),
         "total_columns": len(df.columns),
-        "missing_values_pct": (df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100,
+        "missing_values_pct": (total_missing / (len(df) * len(df.columns))) * 100,
     }
 
     if verbose:
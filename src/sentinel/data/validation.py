@@ -5,40 +5,42 @@ Using Pandera for production-grade data validation
 
 import pandera as pa
 from pandera import Column, DataFrameSchema, Check
+import numpy as np
 import pandas as pd
 from typing import Dict
 
+from .loaders import TRANSACTION_PARSE_DTYPES, narrow_transaction_dtypes
+
+
+# Allowed labels for the categorical transaction columns (tuples: immutable and
+# ordered, so the category codes are stable across processes)
+ALLOWED_COMPANIES = (
+    "BBCA", "BBRI", "BMRI", "TLKM", "ASII",
+    "UNVR", "ICBP", "GGRM", "INDF", "KLBF",
+    "HMSP", "SMGR", "JPFA", "PTPP", "WIKA",
+    "JSMR", "MNC", "PGAS", "ADRO", "ITMG"
+)
+ALLOWED_INSIDER_ROLES = ("Director", "Commissioner", "Major Shareholder (>5%)", "CFO", "CEO")
+ALLOWED_ACTIONS = ("BUY", "SELL")
+
+# Coercing to a fixed-category dtype replaces the per-row isin() scan: labels
+# outside the category set fail the coercion and are reported as failure cases
+COMPANY_DTYPE = pd.CategoricalDtype(ALLOWED_COMPANIES)
+INSIDER_ROLE_DTYPE = pd.CategoricalDtype(ALLOWED_INSIDER_ROLES)
+ACTION_DTYPE = pd.CategoricalDtype(ALLOWED_ACTIONS)
+
 
 # Transaction Data Schema
 transaction_schema = DataFrameSchema(
     {
         "transaction_id": Column(str, nullable=False, unique=True),
-        "date": Column(str, nullable=False),  # Will be converted to datetime
-        "company": Column(
-            str,
-            nullable=False,
-            checks=Check.isin([
-                "BBCA", "BBRI", "BMRI", "TLKM", "ASII",
-                "UNVR", "ICBP", "GGRM", "INDF", "KLBF",
-                "HMSP", "SMGR", "JPFA", "PTPP", "WIKA",
-                "JSMR", "MNC", "PGAS", "ADRO", "ITMG"
-            ])
-        ),
+        "date": Column("datetime64[ns]", nullable=False),
+        "company": Column(COMPANY_DTYPE, nullable=False),
         "insider_name": Column(str, nullable=False),
-        "insider_role": Column(
-            str,
-            nullable=False,
-            checks=Check.isin([
-                "Director", "Commissioner", "Major Shareholder (>5%)", "CFO", "CEO"
-            ])
-        ),
-        "action": Column(
-            str,
-            nullable=False,
-            checks=Check.isin(["BUY", "SELL"])
-        ),
+        "insider_role": Column(INSIDER_ROLE_DTYPE, nullable=False),
+        "action": Column(ACTION_DTYPE, nullable=False),
         "volume": Column(
-            int,
+            TRANSACTION_PARSE_DTYPES["volume"],
             nullable=False,
             checks=[
                 Check.greater_than(0),
@@ -46,16 +48,20 @@ transaction_schema = DataFrameSchema(
             ]
         ),
         "price": Column(
-            int,
+            TRANSACTION_PARSE_DTYPES["price"],
             nullable=False,
             checks=[
                 Check.greater_than(0),
                 Check.less_than(100_000)  # IDR 100k max
             ]
         ),
-        "total_value": Column(int, nullable=False, checks=Check.greater_than(0)),
+        "total_value": Column(
+            TRANSACTION_PARSE_DTYPES["total_value"],
+            nullable=False,
+            checks=Check.greater_than(0)
+        ),
         "days_to_earnings": Column(
-            int,
+            TRANSACTION_PARSE_DTYPES["days_to_earnings"],
             nullable=False,
             checks=[
                 Check.greater_than_or_equal_to(0),
@@ -100,7 +106,8 @@ def validate_transaction_data(df: pd.DataFrame) -> pd.DataFrame:
         pa.errors.SchemaError: If validation fails
     """
     try:
-        validated_df = transaction_schema.validate(df, lazy=True)
+        # Range checks run on Int64 values; narrowing is safe once they pass
+        validated_df = narrow_transaction_dtypes(transaction_schema.validate(df, lazy=True))
         print("✅ Transaction data validation passed")
         return validated_df
     except pa.errors.SchemaErrors as err:
@@ -152,17 +159,18 @@ def get_data_quality_report(df: pd.DataFrame) -> Dict:
         "dtypes": df.dtypes.astype(str).to_dict(),
     }
 
-    # Numeric column statistics
-    numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns
+    # Numeric column statistics (any width - loaders use int8/int32 columns)
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
     if len(numeric_cols) > 0:
         report["numeric_stats"] = df[numeric_cols].describe().to_dict()
 
-    # Categorical column distributions
-    categorical_cols = df.select_dtypes(include=['object', 'bool']).columns
-    if len(categorical_cols) > 0:
+    # Categorical column distributions (value_counts on a categorical is a
+    # bincount over its codes, so label columns stay cheap)
+    categorical_df = df.select_dtypes(include=['object', 'category', 'bool'])
+    if not categorical_df.empty:
         report["categorical_distributions"] = {
-            col: df[col].value_counts().head(10).to_dict()
-            for col in categorical_cols
+            col: values.value_counts().head(10).to_dict()
+            for col, values in categorical_df.items()
         }
 
     return report
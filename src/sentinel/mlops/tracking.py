@@ -12,7 +12,12 @@ Usage:
 """
 
 import mlflow
+from mlflow.entities import Metric, Param, RunStatus
+from mlflow.tracking import MlflowClient
+from mlflow.tracking.context.registry import resolve_tags
 import os
+import time
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from datetime import datetime
 
@@ -21,6 +26,15 @@ MLFLOW_TRACKING_URI = os.getenv("MLFLOW_TRACKING_URI", "http://localhost:5000")
 mlflow.set_tracking_uri(MLFLOW_TRACKING_URI)
 
 
+@lru_cache(maxsize=64)
+def _get_or_create_experiment(name: str) -> str:
+    """Experiment ID for a name, looked up (or created) once per process"""
+    experiment = mlflow.get_experiment_by_name(name)
+    if experiment is None:
+        return mlflow.create_experiment(name)
+    return experiment.experiment_id
+
+
 def log_experiment(
     experiment_name: str,
     params: Dict[str, Any],
@@ -41,36 +55,40 @@ def log_experiment(
     Returns:
         Run ID
     """
-    # Set or create experiment
-    experiment = mlflow.get_experiment_by_name(experiment_name)
-    if experiment is None:
-        experiment_id = mlflow.create_experiment(experiment_name)
-    else:
-        experiment_id = experiment.experiment_id
+    experiment_id = _get_or_create_experiment(experiment_name)
 
-    # Start run
-    with mlflow.start_run(experiment_id=experiment_id) as run:
-        # Log parameters
-        mlflow.log_params(params)
+    # Tags go in with the run (plus the source/user/git tags start_run adds)
+    run_tags = {
+        **(tags or {}),
+        "timestamp": datetime.now().isoformat(),
+        "project": "SENTINEL",
+    }
 
-        # Log metrics
-        mlflow.log_metrics(metrics)
+    # One create + one batch + one terminate call instead of a tracking
+    # server round-trip per params/metrics/tag call
+    client = MlflowClient()
+    run = client.create_run(experiment_id, tags=resolve_tags(run_tags))
+    run_id = run.info.run_id
 
-        # Log tags
-        if tags:
-            mlflow.set_tags(tags)
-
-        # Default tags
-        mlflow.set_tag("timestamp", datetime.now().isoformat())
-        mlflow.set_tag("project", "SENTINEL")
+    try:
+        timestamp = int(time.time() * 1000)
+        client.log_batch(
+            run_id,
+            metrics=[Metric(key, float(value), timestamp, 0) for key, value in metrics.items()],
+            params=[Param(key, str(value)) for key, value in params.items()]
+        )
 
         # Log artifacts
         if artifacts:
             for path, description in artifacts.items():
                 if os.path.exists(path):
-                    mlflow.log_artifact(path)
+                    client.log_artifact(run_id, path)
+    except Exception:
+        client.set_terminated(run_id, RunStatus.to_string(RunStatus.FAILED))
+        raise
 
-        return run.info.run_id
+    client.set_terminated(run_id)
+    return run_id
 
 
 def log_model_metrics(
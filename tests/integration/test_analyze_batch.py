@@ -0,0 +1,177 @@
+"""
+Integration tests for the batch analysis endpoint
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.sentinel.api.main import app
+
+client = TestClient(app)
+
+API_KEY = "dev-key-12345"
+HEADERS = {"X-API-Key": API_KEY}
+
+HIGH_RISK = {
+    "date": "2024-12-29T10:00:00",
+    "company": "BBCA",
+    "insider_name": "John Doe",
+    "insider_role": "Director",
+    "action": "SELL",
+    "volume": 500000,
+    "price": 9500,
+}
+LOW_RISK = {
+    "date": "2024-12-30",
+    "company": "BBRI",
+    "insider_name": "Jane Doe",
+    "insider_role": "Major Shareholder",
+    "action": "BUY",
+    "volume": 1000,
+    "price": 4500,
+}
+
+
+def _analysis(result: dict) -> tuple:
+    """The parts of a result that depend only on the transaction"""
+    return result["alerts"], result["risk_score"], result["citations"]
+
+
+class TestAnalyzeBatchEndpoint:
+    """Test POST /api/v1/analyze/batch"""
+
+    def test_batch_returns_one_result_per_transaction(self):
+        """Results come back in request order with counts filled in"""
+        response = client.post(
+            "/api/v1/analyze/batch",
+            json={"transactions": [HIGH_RISK, LOW_RISK, HIGH_RISK]},
+            headers=HEADERS,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_transactions"] == 3
+        assert len(data["results"]) == 3
+        assert data["processing_time"] >= 0
+
+        high, low, high_again = data["results"]
+        assert high["alerts"] and high["risk_score"] > 0
+        assert low["alerts"] == [] and low["risk_score"] == 0
+        assert _analysis(high_again) == _analysis(high)
+
+        transaction_ids = {result["transaction_id"] for result in data["results"]}
+        assert len(transaction_ids) == 3
+
+    @pytest.mark.parametrize("transaction", [HIGH_RISK, LOW_RISK])
+    def test_batch_matches_single_analysis(self, transaction):
+        """Each batch result equals analyzing the transaction on its own"""
+        single = client.post(
+            "/api/v1/analyze/", json={"transaction": transaction}, headers=HEADERS
+        )
+        batch = client.post(
+            "/api/v1/analyze/batch",
+            json={"transactions": [transaction]},
+            headers=HEADERS,
+        )
+
+        assert single.status_code == 200
+        assert batch.status_code == 200
+        assert _analysis(batch.json()["results"][0]) == _analysis(single.json())
+
+    def test_batch_requires_api_key(self):
+        """Missing and invalid keys are rejected like on /analyze"""
+        body = {"transactions": [LOW_RISK]}
+
+        missing = client.post("/api/v1/analyze/batch", json=body)
+        invalid = client.post(
+            "/api/v1/analyze/batch", json=body, headers={"X-API-Key": "wrong"}
+        )
+
+        assert missing.status_code == 401
+        assert invalid.status_code == 403
+
+    @pytest.mark.parametrize("count", [0, 1001])
+    def test_batch_size_limits(self, count):
+        """Empty batches and batches over 1000 transactions are rejected"""
+        response = client.post(
+            "/api/v1/analyze/batch",
+            json={"transactions": [LOW_RISK] * count},
+            headers=HEADERS,
+        )
+
+        assert response.status_code == 422
+
+    def test_invalid_transaction_rejects_batch(self):
+        """One malformed transaction fails validation for the whole request"""
+        response = client.post(
+            "/api/v1/analyze/batch",
+            json={"transactions": [LOW_RISK, {**LOW_RISK, "date": "2024-13-45"}]},
+            headers=HEADERS,
+        )
+
+        assert response.status_code == 422
+
+
+class TestAnalyzeWithLifespan:
+    """Requests against the app with its startup/shutdown hooks running"""
+
+    def test_single_and_batch_agree(self):
+        """The started service answers /analyze and /batch consistently"""
+        with TestClient(app) as lifespan_client:
+            single = lifespan_client.post(
+                "/api/v1/analyze/", json={"transaction": HIGH_RISK}, headers=HEADERS
+            )
+            batch = lifespan_client.post(
+                "/api/v1/analyze/batch",
+                json={"transactions": [HIGH_RISK, LOW_RISK]},
+                headers=HEADERS,
+            )
+
+        assert single.status_code == 200
+        assert batch.status_code == 200
+        assert _analysis(batch.json()["results"][0]) == _analysis(single.json())
+        assert batch.json()["results"][1]["risk_score"] == 0
+
+    def test_stream(self):
+        """The SSE endpoint streams alerts and a final result"""
+        with TestClient(app) as lifespan_client:
+            response = lifespan_client.post(
+                "/api/v1/analyze/stream",
+                json={"transaction": HIGH_RISK},
+                headers=HEADERS,
+            )
+
+        assert response.status_code == 200
+        events = [
+            line.removeprefix("event: ")
+            for line in response.text.splitlines()
+            if line.startswith("event: ")
+        ]
+        assert events[-1] == "result"
+        assert "alert" in events
+
+    def test_batch_counts_each_transaction(self, monkeypatch):
+        """A batch uses one request of the rate limit per transaction"""
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        from src.sentinel.api.middleware import rate_limit
+
+        monkeypatch.setattr(
+            rate_limit.aioredis, "from_url", lambda url: fakeredis.aioredis.FakeRedis()
+        )
+        monkeypatch.setenv("REDIS_URL", "redis://fake")
+        monkeypatch.setenv("RATE_LIMIT_PER_MINUTE", "3")
+
+        with TestClient(app) as lifespan_client:
+            batch = lifespan_client.post(
+                "/api/v1/analyze/batch",
+                json={"transactions": [LOW_RISK] * 3},
+                headers=HEADERS,
+            )
+            single = lifespan_client.post(
+                "/api/v1/analyze/", json={"transaction": LOW_RISK}, headers=HEADERS
+            )
+
+        assert batch.status_code == 200
+        assert single.status_code == 429
+        assert single.json()["detail"]["code"] == "RATE_LIMITED"
@@ -0,0 +1,142 @@
+"""
+Unit tests for the API micro-batching queue
+"""
+
+import asyncio
+
+import pytest
+
+from src.sentinel.api.services.batching import BatchQueue
+
+
+class RecordingHandler:
+    """Batch handler that records every batch it is called with"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.batches = []
+
+    async def __call__(self, items):
+        self.batches.append(list(items))
+        await asyncio.sleep(self.delay)
+        return [item * 2 for item in items]
+
+
+class TestBatchQueue:
+    """Test suite for BatchQueue"""
+
+    @pytest.mark.asyncio
+    async def test_single_item(self):
+        """One submitted item gets its own result"""
+        handler = RecordingHandler()
+        queue = BatchQueue(handler)
+        await queue.start()
+        try:
+            assert await queue.submit(21) == 42
+        finally:
+            await queue.stop()
+
+        assert handler.batches == [[21]]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_items_are_batched_in_order(self):
+        """Items queued while a batch runs go to the handler together"""
+        handler = RecordingHandler(delay=0.01)
+        queue = BatchQueue(handler)
+        await queue.start()
+        try:
+            results = await asyncio.gather(*(queue.submit(i) for i in range(10)))
+        finally:
+            await queue.stop()
+
+        assert results == [i * 2 for i in range(10)]
+        assert len(handler.batches) < 10
+        assert [item for batch in handler.batches for item in batch] == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_max_batch_respected(self):
+        """No handler call gets more than max_batch items"""
+        handler = RecordingHandler(delay=0.01)
+        queue = BatchQueue(handler, max_batch=3)
+        await queue.start()
+        try:
+            results = await asyncio.gather(*(queue.submit(i) for i in range(10)))
+        finally:
+            await queue.stop()
+
+        assert results == [i * 2 for i in range(10)]
+        assert max(len(batch) for batch in handler.batches) <= 3
+
+    @pytest.mark.asyncio
+    async def test_max_wait_fills_batch(self):
+        """With max_wait_ms, items arriving shortly after the first share its batch"""
+        handler = RecordingHandler()
+        queue = BatchQueue(handler, max_wait_ms=200)
+        await queue.start()
+        try:
+            first = asyncio.create_task(queue.submit(1))
+            await asyncio.sleep(0.01)
+            second = asyncio.create_task(queue.submit(2))
+            results = await asyncio.gather(first, second)
+        finally:
+            await queue.stop()
+
+        assert results == [2, 4]
+        assert handler.batches == [[1, 2]]
+
+    @pytest.mark.asyncio
+    async def test_handler_error_fails_batch_only(self):
+        """A failing batch raises in its callers and the queue keeps running"""
+        calls = []
+
+        async def handler(items):
+            calls.append(items)
+            if len(calls) == 1:
+                raise ValueError("backend down")
+            return items
+
+        queue = BatchQueue(handler)
+        await queue.start()
+        try:
+            with pytest.raises(ValueError, match="backend down"):
+                await queue.submit("a")
+            assert await queue.submit("b") == "b"
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self):
+        """running tracks the background task; start is idempotent"""
+        queue = BatchQueue(RecordingHandler())
+        assert not queue.running
+
+        await queue.start()
+        task = queue._task
+        await queue.start()
+        assert queue.running and queue._task is task
+
+        await queue.stop()
+        assert not queue.running
+
+    @pytest.mark.asyncio
+    async def test_stop_fails_pending_requests(self):
+        """Requests queued or mid-batch when the queue stops get an error"""
+        blocked = asyncio.Event()
+
+        async def handler(items):
+            blocked.set()
+            await asyncio.sleep(10)
+            return items
+
+        queue = BatchQueue(handler, max_batch=1)
+        await queue.start()
+        in_flight = asyncio.create_task(queue.submit(1))
+        await blocked.wait()
+        pending = asyncio.create_task(queue.submit(2))
+        await asyncio.sleep(0)
+
+        await queue.stop()
+        with pytest.raises(RuntimeError, match="stopped"):
+            await pending
+        with pytest.raises(RuntimeError, match="stopped"):
+            await asyncio.wait_for(in_flight, 1)
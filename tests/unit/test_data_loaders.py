@@ -4,6 +4,7 @@ Unit tests for SENTINEL data loaders
 
 import pytest
 import pandas as pd
+import pandera as pa
 from pathlib import Path
 import sys
 
@@ -11,6 +12,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
 
 from sentinel.data.loaders import TransactionDataLoader, NewsDataLoader, RegulationDataLoader
+from sentinel.data.validation import validate_transaction_data
 
 
 class TestTransactionDataLoader:
@@ -104,6 +106,55 @@ class TestTransactionDataLoader:
         assert y.dtype == bool
 
 
+class TestTransactionCsvParsing:
+    """Bad transaction CSVs load and are reported by validation, not the parser"""
+
+    def _load(self, tmp_path, df):
+        df.to_csv(tmp_path / "synthetic_transactions_1.csv", index=False)
+        return TransactionDataLoader(data_dir=str(tmp_path)).load_latest_synthetic()
+
+    def test_valid_file_uses_narrow_dtypes(self, tmp_path, sample_transaction_df):
+        """Clean data ends up in the narrow TRANSACTION_DTYPES"""
+        df = self._load(tmp_path, sample_transaction_df)
+
+        assert df['volume'].dtype == 'int32'
+        assert df['days_to_earnings'].dtype == 'int8'
+        assert df['is_suspicious'].dtype == bool
+        assert pd.api.types.is_datetime64_any_dtype(df['date'])
+
+    def test_missing_value_reported_by_validation(self, tmp_path, sample_transaction_df):
+        """A NaN in an integer column loads and fails validation"""
+        sample_transaction_df['days_to_earnings'] = [45, None, 60]
+        df = self._load(tmp_path, sample_transaction_df)
+
+        assert df['days_to_earnings'].isna().sum() == 1
+        with pytest.raises(pa.errors.SchemaErrors):
+            validate_transaction_data(df)
+
+    def test_out_of_range_value_not_wrapped(self, tmp_path, sample_transaction_df):
+        """Values too large for the narrow dtype are kept and fail validation"""
+        sample_transaction_df['days_to_earnings'] = [45, 300, 60]
+        df = self._load(tmp_path, sample_transaction_df)
+
+        assert df['days_to_earnings'].tolist() == [45, 300, 60]
+        with pytest.raises(pa.errors.SchemaErrors):
+            validate_transaction_data(df)
+
+    def test_missing_date_column_reported_by_validation(self, tmp_path, sample_transaction_df):
+        """A file without a date column loads; validation reports the column"""
+        df = self._load(tmp_path, sample_transaction_df.drop(columns=['date']))
+
+        with pytest.raises(pa.errors.SchemaErrors):
+            validate_transaction_data(df)
+
+    def test_unparseable_value_raises_value_error(self, tmp_path, sample_transaction_df):
+        """Text in a numeric column raises the loader's ValueError"""
+        sample_transaction_df['volume'] = ['1000', 'abc', '1500']
+
+        with pytest.raises(ValueError, match="Could not parse"):
+            self._load(tmp_path, sample_transaction_df)
+
+
 class TestNewsDataLoader:
     """Test suite for NewsDataLoader"""
 
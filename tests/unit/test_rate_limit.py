@@ -0,0 +1,233 @@
+"""
+Unit tests for the Redis-backed API rate limiter
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from src.sentinel.api.middleware import rate_limit
+from src.sentinel.api.middleware.rate_limit import (
+    RedisRateLimiter,
+    acquire_request_slot,
+    enforce_rate_limit,
+    release_after_stream,
+)
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis needs it to run the Lua acquire script
+
+API_KEY = "test-key"
+
+
+@pytest.fixture
+def server():
+    """Shared in-memory Redis server (stands in for the one all workers use)"""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def make_limiter(monkeypatch, server):
+    """Build RedisRateLimiters whose connections go to the fake server"""
+    monkeypatch.setattr(
+        rate_limit.aioredis,
+        "from_url",
+        lambda url: fakeredis.aioredis.FakeRedis(server=server),
+    )
+
+    def _make(**kwargs):
+        return RedisRateLimiter("redis://fake", **kwargs)
+
+    return _make
+
+
+def _request(limiter):
+    """Minimal stand-in for the FastAPI request seen by the dependency"""
+    return SimpleNamespace(
+        app=SimpleNamespace(state=SimpleNamespace(rate_limiter=limiter))
+    )
+
+
+async def _in_flight(limiter) -> int:
+    """Number of in-flight slots held by API_KEY"""
+    return await limiter.redis.zcard(limiter._keys(API_KEY)[1])
+
+
+class TestRedisRateLimiter:
+    """Test suite for RedisRateLimiter"""
+
+    @pytest.mark.asyncio
+    async def test_rejects_over_requests_per_minute(self, make_limiter):
+        """Requests beyond the per-minute limit get 429 RATE_LIMITED"""
+        limiter = make_limiter(requests_per_minute=3, max_concurrent=10)
+
+        for _ in range(3):
+            await limiter.release(API_KEY, await limiter.acquire(API_KEY))
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter.acquire(API_KEY)
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.detail["code"] == "RATE_LIMITED"
+        assert exc_info.value.headers["Retry-After"] == "60"
+
+    @pytest.mark.asyncio
+    async def test_rejects_over_max_concurrent(self, make_limiter):
+        """Unreleased slots beyond max_concurrent get 429 CONCURRENCY_LIMITED"""
+        limiter = make_limiter(requests_per_minute=10, max_concurrent=2)
+
+        await limiter.acquire(API_KEY)
+        await limiter.acquire(API_KEY)
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter.acquire(API_KEY)
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.detail["code"] == "CONCURRENCY_LIMITED"
+
+    @pytest.mark.asyncio
+    async def test_rejected_request_not_counted(self, make_limiter):
+        """A request turned away for concurrency doesn't use up the rate window"""
+        limiter = make_limiter(requests_per_minute=2, max_concurrent=1)
+
+        request_id = await limiter.acquire(API_KEY)
+        with pytest.raises(HTTPException):
+            await limiter.acquire(API_KEY)
+        await limiter.release(API_KEY, request_id)
+        await limiter.acquire(API_KEY)
+
+    @pytest.mark.asyncio
+    async def test_limits_are_per_api_key(self, make_limiter):
+        """One key hitting its limit doesn't affect another"""
+        limiter = make_limiter(requests_per_minute=1, max_concurrent=1)
+
+        await limiter.acquire(API_KEY)
+        await limiter.acquire("other-key")
+
+    @pytest.mark.asyncio
+    async def test_limits_shared_across_workers(self, make_limiter):
+        """Limiters of different workers count against the same Redis state"""
+        worker_a = make_limiter(requests_per_minute=10, max_concurrent=1)
+        worker_b = make_limiter(requests_per_minute=10, max_concurrent=1)
+
+        await worker_a.acquire(API_KEY)
+        with pytest.raises(HTTPException):
+            await worker_b.acquire(API_KEY)
+
+    @pytest.mark.asyncio
+    async def test_cost_counts_against_rate_window(self, make_limiter):
+        """A request of cost n uses n requests of the per-minute limit"""
+        limiter = make_limiter(requests_per_minute=5, max_concurrent=10)
+
+        await limiter.release(API_KEY, await limiter.acquire(API_KEY, cost=4))
+        await limiter.release(API_KEY, await limiter.acquire(API_KEY))
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter.acquire(API_KEY)
+
+        assert exc_info.value.detail["code"] == "RATE_LIMITED"
+
+    @pytest.mark.asyncio
+    async def test_cost_counts_against_concurrency(self, make_limiter):
+        """An in-flight request of cost n holds n concurrent slots"""
+        limiter = make_limiter(requests_per_minute=100, max_concurrent=3)
+
+        request_id = await limiter.acquire(API_KEY, cost=3)
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter.acquire(API_KEY)
+        assert exc_info.value.detail["code"] == "CONCURRENCY_LIMITED"
+
+        await limiter.release(API_KEY, request_id)
+        await limiter.acquire(API_KEY)
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_needs_whole_budget(self, make_limiter):
+        """A cost above the limit runs only when the key is idle, then blocks others"""
+        limiter = make_limiter(requests_per_minute=5, max_concurrent=2)
+
+        await limiter.release(API_KEY, await limiter.acquire(API_KEY))
+        with pytest.raises(HTTPException):
+            await limiter.acquire(API_KEY, cost=50)
+
+        await limiter.release("idle-key", await limiter.acquire("idle-key", cost=50))
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter.acquire("idle-key")
+        assert exc_info.value.detail["code"] == "RATE_LIMITED"
+
+
+class TestEnforceRateLimit:
+    """Test suite for the enforce_rate_limit dependency"""
+
+    @pytest.mark.asyncio
+    async def test_slot_released_after_response(self, make_limiter):
+        """The in-flight slot is held while the request runs and freed afterwards"""
+        limiter = make_limiter(requests_per_minute=10, max_concurrent=1)
+
+        dependency = enforce_rate_limit(_request(limiter), api_key=API_KEY)
+        assert await dependency.__anext__() == API_KEY
+        assert await _in_flight(limiter) == 1
+
+        # FastAPI resumes the generator once the endpoint returns
+        with pytest.raises(StopAsyncIteration):
+            await dependency.__anext__()
+        assert await _in_flight(limiter) == 0
+
+    @pytest.mark.asyncio
+    async def test_slot_released_when_request_fails(self, make_limiter):
+        """An exception in the endpoint still frees the slot"""
+        limiter = make_limiter(requests_per_minute=10, max_concurrent=1)
+
+        dependency = enforce_rate_limit(_request(limiter), api_key=API_KEY)
+        await dependency.__anext__()
+        with pytest.raises(RuntimeError):
+            await dependency.athrow(RuntimeError("analysis failed"))
+        assert await _in_flight(limiter) == 0
+
+    @pytest.mark.asyncio
+    async def test_fails_open_on_redis_error(self, make_limiter, server):
+        """A Redis outage lets requests through instead of failing them"""
+        limiter = make_limiter()
+        server.connected = False
+
+        dependency = enforce_rate_limit(_request(limiter), api_key=API_KEY)
+        assert await dependency.__anext__() == API_KEY
+        with pytest.raises(StopAsyncIteration):
+            await dependency.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_no_limiter_configured(self):
+        """Without REDIS_URL the dependency just passes the key through"""
+        dependency = enforce_rate_limit(_request(None), api_key=API_KEY)
+
+        assert await dependency.__anext__() == API_KEY
+
+
+class TestReleaseAfterStream:
+    """Test suite for streaming-response slot handling"""
+
+    @staticmethod
+    async def _events():
+        """Two-event SSE body"""
+        yield b"event: alert\n\n"
+        yield b"event: result\n\n"
+
+    @pytest.mark.asyncio
+    async def test_slot_held_until_stream_ends(self, make_limiter):
+        """The slot stays taken while the body is sent and is freed at the end"""
+        limiter = make_limiter(requests_per_minute=10, max_concurrent=1)
+        release = await acquire_request_slot(_request(limiter), API_KEY)
+        stream = release_after_stream(self._events(), release)
+
+        assert await stream.__anext__() == b"event: alert\n\n"
+        assert await _in_flight(limiter) == 1
+        assert [chunk async for chunk in stream] == [b"event: result\n\n"]
+        assert await _in_flight(limiter) == 0
+
+    @pytest.mark.asyncio
+    async def test_slot_released_on_disconnect(self, make_limiter):
+        """Closing the stream early (client went away) frees the slot"""
+        limiter = make_limiter(requests_per_minute=10, max_concurrent=1)
+        release = await acquire_request_slot(_request(limiter), API_KEY)
+        stream = release_after_stream(self._events(), release)
+
+        await stream.__anext__()
+        await stream.aclose()
+        assert await _in_flight(limiter) == 0